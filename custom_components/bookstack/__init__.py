@@ -24,11 +24,8 @@ from __future__ import annotations
 
 import logging
 
-import voluptuous as vol # type: ignore
-
 from homeassistant.config_entries import ConfigEntry # type: ignore
-from homeassistant.core import HomeAssistant, ServiceCall, SupportsResponse # type: ignore
-from homeassistant.exceptions import ServiceValidationError # type: ignore
+from homeassistant.core import HomeAssistant # type: ignore
 from homeassistant.helpers import config_validation # type: ignore
 from homeassistant.helpers.aiohttp_client import async_get_clientsession # type: ignore
 
@@ -38,12 +35,6 @@ from .const import (
     CONF_SCAN_INTERVAL,
     CONF_PER_SHELF_ENABLED,
     DEFAULT_SCAN_INTERVAL,
-    ACTION_CREATE_BOOK,
-    ACTION_CREATE_PAGE,
-    ACTION_APPEND_PAGE,
-    ACTION_LIST_BOOKS,
-    ACTION_LIST_CHAPTERS,
-    ACTION_LIST_PAGES,
 )
 from .coordinator import BookStackCoordinator
 
@@ -55,243 +46,24 @@ CONFIG_SCHEMA = config_validation.config_entry_only_config_schema(DOMAIN)
 _LOGGER = logging.getLogger(__name__)
 
 
-# Voluptuous schema that validates the data payload when the create_book action is called (from the UI, an automation, or a script). 
-# HA validates this before  our handler runs, so we can trust the types and required fields are present.
-# Field notes:
-#   shelf_id    — 
-#   name        — non-empty string; config_validation.string also strips leading/trailing whitespace
-#   description — optional, defaults to an empty string
-#   tags        — optional list of tag dicts with required "name" and optional "value"; defaults to an empty list
-CREATE_BOOK_SCHEMA = vol.Schema(
-    {
-        vol.Required("shelf_id"): vol.All(int, vol.Range(min=1)), # must be a positive integer (BookStack IDs start at 1)
-        vol.Required("name"): config_validation.string, # non-empty string; config_validation.string also strips leading/trailing whitespace
-        vol.Optional("description", default=""): config_validation.string, # optional, defaults to an empty string
-        vol.Optional("tags", default=[]): [
-            vol.Schema(
-                {
-                    vol.Required("name"): config_validation.string,
-                    vol.Optional("value", default=""): config_validation.string,
-                }
-            )
-        ],
-    }
-)
-
-# Voluptuous schema that validates the data payload when the create_page action is called. Both html and markdown are optional at the schema 
-# level — the coordinator enforces that exactly one must be supplied, since Voluptuous cannot handle mutual exclusivity.
-# Field notes:
-#   book_id    — required; the book the page will be created in
-#   chapter_id — optional; if supplied the page is nested inside that chapter
-#   name       — non-empty string; the page title
-#   html       — page content as HTML; mutually exclusive with markdown
-#   markdown   — page content as Markdown; mutually exclusive with html
-#   tags       — optional list of tag dicts with required "name" and optional "value"
-CREATE_PAGE_SCHEMA = vol.Schema(
-    {
-        vol.Required("book_id"): vol.All(int, vol.Range(min=1)),
-        vol.Optional("chapter_id"): vol.All(int, vol.Range(min=1)),
-        vol.Required("name"): config_validation.string,
-        vol.Optional("html"): config_validation.string,
-        vol.Optional("markdown"): config_validation.string,
-        vol.Optional("tags", default=[]): [
-            vol.Schema(
-                {
-                    vol.Required("name"): config_validation.string,
-                    vol.Optional("value", default=""): config_validation.string,
-                }
-            )
-        ],
-    }
-)
-
-# Voluptuous schema that validates the data payload when the append_page action is called. As with create_page, html and markdown are 
-# both optional at the schema level. The coordinator enforces that exactly one must be supplied and that it matches the existing page's
-# content type.
-# Field notes:
-#   page_id  — required; the ID of the page to append content to
-#   html     — content to append as HTML; mutually exclusive with markdown
-#   markdown — content to append as Markdown; mutually exclusive with html
-#   tags     — optional list of tag dicts to add to the page; existing tags are preserved
-APPEND_PAGE_SCHEMA = vol.Schema(
-    {
-        vol.Required("page_id"): vol.All(int, vol.Range(min=1)),
-        vol.Optional("html"): config_validation.string,
-        vol.Optional("markdown"): config_validation.string,
-        vol.Optional("tags", default=[]): [
-            vol.Schema(
-                {
-                    vol.Required("name"): config_validation.string,
-                    vol.Optional("value", default=""): config_validation.string,
-                }
-            )
-        ],
-    }
-)
-
-# Voluptuous schema for the list_books action. shelf_id is entirely optional; when omitted all books are returned, when provided only 
-# books on that shelf are returned.
-# Field notes:
-#   shelf_id  — required; the ID of the shelf to list books from
-LIST_BOOKS_SCHEMA = vol.Schema(
-    {
-        vol.Optional("shelf_id"): vol.All(int, vol.Range(min=1)),
-    }
-)
-
-# Voluptuous schema for the list_chapters action. book_id is required as chapters are always scoped to a specific book.
-# Field notes:
-#   book_id  — required; the ID of the book to list chapters from
-LIST_CHAPTERS_SCHEMA = vol.Schema(
-    {
-        vol.Required("book_id"): vol.All(int, vol.Range(min=1)),
-    }
-)
-
-# Voluptuous schema for the list_pages action. book_id is required; chapter_id is optional and, when supplied, narrows results to pages 
-# within that chapter. If the chapter does not belong to the book a ServiceValidationError is raised by the coordinator.
-# Field notes:
-#   book_id  — required; the ID of the book to list pages from
-#   chapter_id — optional; the ID of the chapter to list pages from. Must belong to the book specified by book_id
-LIST_PAGES_SCHEMA = vol.Schema(
-    {
-        vol.Required("book_id"): vol.All(int, vol.Range(min=1)),
-        vol.Optional("chapter_id"): vol.All(int, vol.Range(min=1)),
-    }
-)
-
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Register BookStack service actions at integration load time.
 
-    Actions are registered in async_setup (not async_setup_entry) so they are available immediately on load and never duplicated across 
-    multiple config entries. Each handler resolves the correct coordinator at call-time. This satisfies the Bronze quality-scale rule 
+    Actions are registered in async_setup (not async_setup_entry) so they are available immediately on load and never duplicated across
+    multiple config entries. Each handler resolves the correct coordinator at call-time. This satisfies the Bronze quality-scale rule
     'action-setup'.
-    """
-
-    def _get_coordinator(call: ServiceCall) -> BookStackCoordinator:
-        """Resolve and return the coordinator for the targeted config entry."""
-        entries = hass.config_entries.async_entries(DOMAIN)
-        target_id: str | None = call.data.get("config_entry_id")
-        if target_id:
-            entry = hass.config_entries.async_get_entry(target_id)
-        else:
-            entry = entries[0] if entries else None
 
-        if entry is None:
-            raise ServiceValidationError(
-                "No BookStack config entry found"
-                + (f" with ID '{target_id}'" if target_id else "")
-            )
-
-        coordinator: BookStackCoordinator = entry.runtime_data
-        if not coordinator.is_available:
-            raise ServiceValidationError(
-                "BookStack is currently unavailable. Check the Connectivity sensor and your BookStack server before retrying."
-            )
-        return coordinator
-
-    # Define the handlers for each action. Each handler retrieves the appropriate coordinator and calls the corresponding async 
-    # method, passing in the validated data from the service call. The coordinator methods perform the actual API calls to BookStack 
-    # and return the results, which are then returned as the service response.
-    async def handle_create_book(call: ServiceCall) -> dict:
-        """Handle the bookstack.create_book action."""
-        coordinator = _get_coordinator(call)
-        return await coordinator.async_create_book(
-            shelf_id=call.data["shelf_id"],
-            name=call.data["name"],
-            description=call.data.get("description", ""),
-            tags=call.data.get("tags", []),
-        )
-
-    async def handle_create_page(call: ServiceCall) -> dict:
-        """Handle the bookstack.create_page action."""
-        coordinator = _get_coordinator(call)
-        return await coordinator.async_create_page(
-            book_id=call.data["book_id"],
-            name=call.data["name"],
-            chapter_id=call.data.get("chapter_id"),
-            html=call.data.get("html"),
-            markdown=call.data.get("markdown"),
-            tags=call.data.get("tags", []),
-        )
-
-    async def handle_append_page(call: ServiceCall) -> dict:
-        """Handle the bookstack.append_page action."""
-        coordinator = _get_coordinator(call)
-        return await coordinator.async_append_page(
-            page_id=call.data["page_id"],
-            html=call.data.get("html"),
-            markdown=call.data.get("markdown"),
-            tags=call.data.get("tags", []),
-        )
-
-    async def handle_list_books(call: ServiceCall) -> dict:
-        """Handle the bookstack.list_books action."""
-        coordinator = _get_coordinator(call)
-        return await coordinator.async_list_books(
-            shelf_id=call.data.get("shelf_id"),
-        )
-
-    async def handle_list_chapters(call: ServiceCall) -> dict:
-        """Handle the bookstack.list_chapters action."""
-        coordinator = _get_coordinator(call)
-        return await coordinator.async_list_chapters(
-            book_id=call.data["book_id"],
-        )
-    
-    async def handle_list_pages(call: ServiceCall) -> dict:
-        """Handle the bookstack.list_pages action."""
-        coordinator = _get_coordinator(call)
-        return await coordinator.async_list_pages(
-            book_id=call.data["book_id"],
-            chapter_id=call.data.get("chapter_id"),
-        )
+    The services module (and with it Voluptuous plus the schema construction) is imported here rather than at the top of the file, so
+    the package import HA performs during startup stays cheap; the action machinery only loads once setup actually runs.
+    """
+    from .services import async_setup_services
 
-    # Register the actions with Home Assistant. Each action is registered with its name, handler function, and schema for validating 
-    # input data. The supports_response flag indicates whether the action returns data that should be included in the service response.
-    hass.services.async_register(
-        domain=DOMAIN,
-        service=ACTION_CREATE_BOOK,
-        service_func=handle_create_book,
-        schema=CREATE_BOOK_SCHEMA,
-        supports_response=SupportsResponse.OPTIONAL,
-    )
-    hass.services.async_register(
-        domain=DOMAIN,
-        service=ACTION_CREATE_PAGE,
-        service_func=handle_create_page,
-        schema=CREATE_PAGE_SCHEMA,
-        supports_response=SupportsResponse.OPTIONAL,
-    )
-    hass.services.async_register(
-        domain=DOMAIN,
-        service=ACTION_APPEND_PAGE,
-        service_func=handle_append_page,
-        schema=APPEND_PAGE_SCHEMA,
-        supports_response=SupportsResponse.OPTIONAL,
-    )
-    hass.services.async_register(
-        domain=DOMAIN,
-        service=ACTION_LIST_BOOKS,
-        service_func=handle_list_books,
-        schema=LIST_BOOKS_SCHEMA,
-        supports_response=SupportsResponse.ONLY,
-    )
-    hass.services.async_register(
-        domain=DOMAIN,
-        service=ACTION_LIST_CHAPTERS,
-        service_func=handle_list_chapters,
-        schema=LIST_CHAPTERS_SCHEMA,
-        supports_response=SupportsResponse.ONLY,
-    )
-    hass.services.async_register(
-        domain=DOMAIN,
-        service=ACTION_LIST_PAGES,
-        service_func=handle_list_pages,
-        schema=LIST_PAGES_SCHEMA,
-        supports_response=SupportsResponse.ONLY,
-    )
+    async_setup_services(hass)
 
+    # Note: the actions are intentionally never unregistered. Because registration happens once here at integration load (not per
+    # config entry), there are no per-entry entry.async_on_unload(lambda: async_remove(...)) callbacks to maintain, and unloading one
+    # entry can never strip the actions out from under another entry. The handlers simply fail with a clear error when no loaded
+    # entry remains.
     return True
 
 
@@ -301,7 +73,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     Creates the coordinator, performs the first refresh (raises ConfigEntryNotReady on failure), stores it on entry.runtime_data, then
     forwards platform setup to sensor.py and binary_sensor.py.
     """
-    session = async_get_clientsession(hass)
+    # Reuse the shared client session across entry setups/reloads. HA hands back the same session object anyway, but stashing it in
+    # hass.data skips the helper's lookup chain on reload and gives us a single place to hang future connector tuning off.
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    session = domain_data.get("session")
+    if session is None:
+        session = domain_data["session"] = async_get_clientsession(hass)
 
     scan_interval = entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
     per_shelf_enabled = entry.options.get(CONF_PER_SHELF_ENABLED, True)
@@ -309,10 +86,22 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     coordinator = BookStackCoordinator(
         hass, session, entry.data, scan_interval, per_shelf_enabled
     )
-    await coordinator.async_config_entry_first_refresh()
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        # The coordinator opened its dedicated BookStack session/connector in the constructor. If the first refresh fails —
+        # ConfigEntryNotReady while the server is down (HA then retries setup, building a fresh coordinator each attempt) or
+        # ConfigEntryAuthFailed — nothing else owns the session yet, so it must be closed here or every failed attempt leaks its
+        # sockets and logs "Unclosed client session" noise.
+        await coordinator.async_shutdown()
+        raise
 
     entry.runtime_data = coordinator
 
+    # Also keep a pre-resolved entry_id -> coordinator map in hass.data so the action handlers can find the right coordinator with a
+    # single dict lookup instead of going through the config-entries registry on every call.
+    domain_data.setdefault("coordinators", {})[entry.entry_id] = coordinator
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     entry.async_on_unload(entry.add_update_listener(_async_update_listener))
@@ -327,4 +116,10 @@ async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> Non
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a BookStack config entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    # Drop the entry's coordinator from the action-handler lookup map so calls targeting it fail cleanly after unload.
+    hass.data.get(DOMAIN, {}).get("coordinators", {}).pop(entry.entry_id, None)
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    # Stop the poll timer and close the coordinator's dedicated BookStack session/connector. This runs even when a platform failed
+    # to unload — the entry is going away either way, and skipping it would leak the session and its sockets.
+    await entry.runtime_data.async_shutdown()
+    return unload_ok
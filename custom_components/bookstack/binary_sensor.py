@@ -8,13 +8,11 @@ from __future__ import annotations
 
 from homeassistant.components.binary_sensor import BinarySensorEntity, BinarySensorDeviceClass # type: ignore
 from homeassistant.config_entries import ConfigEntry # type: ignore
-from homeassistant.core import HomeAssistant # type: ignore
+from homeassistant.core import HomeAssistant, callback # type: ignore
 from homeassistant.helpers.entity import EntityCategory # type: ignore
 from homeassistant.helpers.entity_platform import AddEntitiesCallback # type: ignore
 from homeassistant.helpers.update_coordinator import CoordinatorEntity # type: ignore
-from homeassistant.helpers.device_registry import DeviceInfo # type: ignore
 
-from .const import DOMAIN
 from .coordinator import BookStackCoordinator
 
 # Only allow a single sensor update at a time to avoid HA warnings about overlapping updates. This is important because the coordinator 
@@ -37,33 +35,22 @@ async def async_setup_entry(
     async_add_entities([BookStackConnectivitySensor(coordinator, entry)])
 
 
-def _device_info(coordinator: BookStackCoordinator, entry: ConfigEntry) -> DeviceInfo:
-    """Return shared DeviceInfo for all BookStack entities.
-
-    All entities in this integration belong to the same device, which represents the BookStack instance. This function constructs a 
-    DeviceInfo object in the HA device registry with identifiers, name, manufacturer, model, software version, and configuration URL 
-    (link to the BookStack instance).
-    """
-    return DeviceInfo(
-        identifiers={(DOMAIN, entry.entry_id)},
-        name=f"BookStack ({entry.data['url']})",
-        manufacturer="BookStack",
-        model="BookStack",
-        sw_version=coordinator.version,
-        configuration_url=entry.data["url"],
-    )
-
-
 class BookStackConnectivitySensor(CoordinatorEntity[BookStackCoordinator], BinarySensorEntity):
     """Binary sensor indicating whether BookStack is reachable.
 
     Shown under the Diagnostic section of the device page. State: on = reachable, off = unreachable.
     """
 
+    # Empty __slots__ keeps this subclass from adding its own __dict__ layer on top of the parent entity classes; all instance
+    # attributes land in the base Entity's key-sharing dict instead.
+    __slots__ = ()
+
     _attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_has_entity_name = True
     _attr_translation_key = "connectivity"  # resolved via strings.json entity section
+    # Class-level default so the instance dict layout is stable before the first coordinator update writes the real value.
+    _attr_is_on: bool | None = None
 
     def __init__(
         self,
@@ -73,12 +60,19 @@ class BookStackConnectivitySensor(CoordinatorEntity[BookStackCoordinator], Binar
         """Initialise the connectivity sensor."""
         super().__init__(coordinator)
         self._attr_unique_id = f"{entry.entry_id}_connectivity"
-        self._attr_device_info = _device_info(coordinator, entry)
-
-    @property
-    def is_on(self) -> bool:
-        """Return True when BookStack was successfully reached on the last poll.
-
-        The coordinator sets is_available=True after a successful fetch and is_available=False on any connection error or auth failure.
+        # All BookStack entities share one device; the coordinator caches the DeviceInfo so every entity reuses the same dict.
+        self._attr_device_info = coordinator.device_info(entry)
+        # Seed the cached state from the coordinator; kept current by _handle_coordinator_update below.
+        self._attr_is_on = coordinator.last_update_success
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the cached on/off state when the coordinator publishes new data.
+
+        last_update_success is the coordinator's built-in availability flag: True after a successful fetch, False on any connection
+        error or auth failure. Caching it into _attr_is_on here means HA's frequent state reads (state machine, templates) are a
+        plain attribute access instead of a property walking back to the coordinator on every read — the work moves to the rare
+        update event.
         """
-        return self.coordinator.is_available
\ No newline at end of file
+        self._attr_is_on = self.coordinator.last_update_success
+        super()._handle_coordinator_update()
\ No newline at end of file
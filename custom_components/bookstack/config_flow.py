@@ -6,12 +6,18 @@ credentials, and creates config entries that store the necessary information to
 """
 
 from __future__ import annotations
-from xml.parsers.expat import errors
+
+import asyncio
+import functools
+import re
+import time
+from collections import OrderedDict
 
 import voluptuous as vol # type: ignore
 import aiohttp # type: ignore
 
 from homeassistant import config_entries # type: ignore
+from homeassistant.core import HomeAssistant # type: ignore
 from homeassistant.helpers.aiohttp_client import async_get_clientsession # type: ignore
 from homeassistant.exceptions import ConfigEntryAuthFailed # type: ignore
 
@@ -26,7 +32,119 @@ from .const import (
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_VERIFY_SSL,
 )
-from .options_flow import BookStackOptionsFlow
+# Voluptuous schemas for the user and reauth forms, built once at module import. These forms are re-rendered on every submission with
+# errors, and rebuilding the schema (dict allocation, marker construction, validator compilation) on each render is wasted work — the
+# field definitions and defaults never change between renders, so a single shared schema object is safe to reuse. The reconfigure step
+# keeps building its schema per render because its defaults come from the specific config entry being reconfigured.
+_USER_SCHEMA = vol.Schema({
+    vol.Required(CONF_URL): str,
+    vol.Required(CONF_TOKEN_ID): str,
+    vol.Required(CONF_TOKEN_SECRET): str,
+    vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): int,
+    vol.Optional(CONF_PER_SHELF_ENABLED, default=True): bool,
+    vol.Optional(CONF_VERIFY_SSL, default=DEFAULT_VERIFY_SSL): bool,
+})
+
+_REAUTH_SCHEMA = vol.Schema({
+    vol.Required(CONF_TOKEN_ID): str,
+    vol.Required(CONF_TOKEN_SECRET): str,
+})
+
+# Quick client-side sanity check for the URL field, compiled once at import. A URL pasted without a scheme (e.g. just
+# "bookstack.example.com") would otherwise go through a full DNS/TCP attempt and time out before the user sees an error; matching this
+# regex first turns that into an instant "invalid_url" message.
+_URL_RE = re.compile(r"^https?://[^\s/]+", re.IGNORECASE)
+
+
+# Timeout for the validation probe, built once and shared across calls. Splitting the budget (3s to connect, 5s per read, 10s overall)
+# means an unreachable or black-holed host fails at the connect stage in ~3 seconds instead of eating the whole 10-second total before
+# the user sees "cannot_connect".
+_VALIDATE_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=3, sock_connect=3, sock_read=5)
+
+
+@functools.lru_cache(maxsize=8)
+def _auth_header(token_id: str, token_secret: str) -> str:
+    """Build the BookStack Authorization header value for a token pair.
+
+    Memoized so repeated validation attempts with the same credentials (typical during a reauth retry loop, where the user resubmits the
+    form several times) reuse the same string instead of re-formatting it. The cache is tiny and in-process only.
+    """
+    return f"Token {token_id}:{token_secret}"
+
+
+# Short-lived cache of validation outcomes keyed by (url, token_id, token_secret). Rapid form resubmissions with the same (often
+# mistyped) credentials would otherwise fire a full HTTP round-trip at the BookStack instance each time; for a few seconds the previous
+# definitive answer (valid, or 401-rejected) is replayed instantly instead. Network failures are deliberately never cached — a retry
+# after a connection blip must probe again.
+_VALIDATE_CACHE: OrderedDict[tuple[str, str, str], tuple[float, bool]] = OrderedDict()
+_VALIDATE_CACHE_MAX = 16
+_VALIDATE_CACHE_TTL = 5.0
+
+
+def _store_validation(key: tuple[str, str, str], valid: bool) -> None:
+    """Record a definitive validation outcome, evicting the oldest entry when the cache is full."""
+    _VALIDATE_CACHE[key] = (time.monotonic(), valid)
+    _VALIDATE_CACHE.move_to_end(key)
+    while len(_VALIDATE_CACHE) > _VALIDATE_CACHE_MAX:
+        _VALIDATE_CACHE.popitem(last=False)
+
+
+async def _validate_input(hass: HomeAssistant, data: dict) -> bool:
+    """Validate API credentials by calling the BookStack API
+
+    Calls the "/api/system" endpoint which requires authentication. A 200 response means the credentials are valid; a 401 response
+    raises ConfigEntryAuthFailed to indicate invalid credentials. For any other exceptions (e.g., network issues), we return False
+    to indicate a connection problem. Definitive outcomes are cached for a few seconds (see _VALIDATE_CACHE) so hammering the submit
+    button doesn't hammer the BookStack instance.
+    """
+    cache_key = (data[CONF_URL], data[CONF_TOKEN_ID], data[CONF_TOKEN_SECRET])
+    cached = _VALIDATE_CACHE.get(cache_key)
+    if cached is not None and time.monotonic() - cached[0] < _VALIDATE_CACHE_TTL:
+        if cached[1]:
+            return True
+        raise ConfigEntryAuthFailed # Replay the cached 401 outcome without another round-trip.
+
+    session = async_get_clientsession(hass)
+    # BookStack API uses token-based authentication where the token ID and secret are combined in the Authorization header. The
+    # header string itself is memoized by _auth_header across repeated attempts with the same credentials. Connection: keep-alive
+    # is explicit (it is the HTTP/1.1 default, but some reverse proxies honour it only when stated) so the shared session's
+    # connector keeps the probe socket pooled — the coordinator's first refresh right after setup/reauth then reuses the warm
+    # TCP/TLS connection instead of paying a fresh handshake.
+    headers = {
+        "Authorization": _auth_header(data[CONF_TOKEN_ID], data[CONF_TOKEN_SECRET]),
+        "Connection": "keep-alive",
+    }
+    # The URL for the system endpoint, using the configured base URL. We strip the trailing slash once to avoid double slashes in
+    # the final URL, then join with plain concatenation.
+    url = data[CONF_URL].rstrip("/") + "/api/system"
+    # Use the shared module-level timeout so the form doesn't hang for too long if there are connection issues (see
+    # _VALIDATE_TIMEOUT for the connect/read split).
+    timeout = _VALIDATE_TIMEOUT
+    # Determine whether to verify SSL certificates. When verify_ssl is False we pass ssl=False to aiohttp, which disables
+    # certificate verification. This is useful for self-signed or internal certificates.
+    ssl = data.get(CONF_VERIFY_SSL, DEFAULT_VERIFY_SSL) or False
+
+    try:
+        async with session.get(url, headers=headers, timeout=timeout, ssl=ssl) as resp: # Make the HTTP GET request to the API
+            if resp.status == 401:
+                # The API explicitly rejected the credentials
+                _store_validation(cache_key, False)
+                raise ConfigEntryAuthFailed
+            if resp.status != 200:
+                # Any other non-success status code is treated as a connection issue (and not cached — it may be transient)
+                return False
+            # A 200 from /api/system already proves the URL points at a BookStack API and the credentials were accepted — the
+            # endpoint rejects unauthenticated requests with 401, so there is no need to download and parse the JSON body just to
+            # look for a "version" key. Skipping resp.json() avoids buffering and parsing the response on the event loop.
+            _store_validation(cache_key, True)
+            return True
+    except ConfigEntryAuthFailed:
+        raise # Let the caller handle this specific exception to show an "invalid_auth" error message
+    except aiohttp.ClientSSLError:
+        raise # Let the caller handle this specific exception to show an "ssl_error" error message
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        # Handle any network level errors (e.g., connection refused, DNS failure) or timeouts as a connection issue
+        return False
 
 
 class BookStackConfigFlow(config_entries.ConfigFlow, domain=DOMAIN): # type: ignore
@@ -41,9 +159,8 @@ class BookStackConfigFlow(config_entries.ConfigFlow, domain=DOMAIN): # type: ign
         with the provided data and options.
     - async_step_reauth: A step that can be triggered when the user needs to update their credentials. This is useful for handling 
         cases where the API credentials are no longer valid or have changed. 
-    - _validate_input: A helper method that performs the actual validation of the API credentials by making a request to the BookStack 
-        API. This method is called from both the user step and the reauth step to ensure that the provided credentials are valid before 
-        creating or updating a config entry.
+    The actual credential validation lives in the module-level _validate_input function (it only needs hass, not the flow instance),
+    which every step calls to ensure the provided credentials are valid before creating or updating a config entry.
     - async_get_options_flow: A static method that returns the options flow handler for this integration, allowing users to configure 
         additional options after the initial setup.
     """
@@ -71,22 +188,39 @@ class BookStackConfigFlow(config_entries.ConfigFlow, domain=DOMAIN): # type: ign
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            # Use the normalised URL (without trailing slash) as the unique ID for this config entry. This ensures that if the 
+            # Reject obviously malformed URLs (missing scheme or host) before doing anything else — this avoids a pointless network
+            # probe that would only fail after the connect timeout.
+            if not _URL_RE.match(user_input[CONF_URL]):
+                errors["base"] = "invalid_url"
+                return self.async_show_form(
+                    step_id="user",
+                    data_schema=_USER_SCHEMA,
+                    errors=errors,
+                    description_placeholders={
+                        "example_url": "https://bookstack.example.com",
+                    },
+                )
+
+            # Normalise the URL (strip any trailing slash) once up front; it is reused below for the unique ID, the stored data, and
+            # the entry title rather than re-stripping the same string at each site.
+            normalized_url = user_input[CONF_URL].rstrip("/")
+
+            # Use the normalised URL as the unique ID for this config entry. This ensures that if the
             # user tries to set up the same instance twice, it will be detected and aborted.
-            await self.async_set_unique_id(user_input[CONF_URL].rstrip("/"))
+            await self.async_set_unique_id(normalized_url)
             self._abort_if_unique_id_configured()
             
             # The user submitted the form, so we need to validate the input. We call the _validate_input method, which will attempt to 
             # connect to the BookStack API with the provided credentials.
             try:
-                if await self._validate_input(user_input):
+                if await _validate_input(self.hass, user_input):
 
                     # Define the config into two buckets, data and options. Data contains the required information for connecting to 
                     # the API (URL and credentials), while options contain optional settings like scan interval and per-shelf enabled 
                     # status. Options can be changed later through the options flow without needing to re-authenticate, while data 
                     # changes would require re-authentication.
                     data = {
-                        CONF_URL: user_input[CONF_URL].rstrip("/"),
+                        CONF_URL: normalized_url,
                         CONF_TOKEN_ID: user_input[CONF_TOKEN_ID],
                         CONF_TOKEN_SECRET: user_input[CONF_TOKEN_SECRET],
                         CONF_VERIFY_SSL: user_input.get(CONF_VERIFY_SSL, DEFAULT_VERIFY_SSL),
@@ -102,7 +236,7 @@ class BookStackConfigFlow(config_entries.ConfigFlow, domain=DOMAIN): # type: ign
                     # integration using this config entry. The title of the config entry is set to "BookStack (URL)" for easy 
                     # identification in the HA UI.
                     return self.async_create_entry(
-                        title=f"BookStack ({data[CONF_URL]})",
+                        title=f"BookStack ({normalized_url})",
                         data=data,
                         options=options,
                     )
@@ -117,27 +251,18 @@ class BookStackConfigFlow(config_entries.ConfigFlow, domain=DOMAIN): # type: ign
                 # We add an error with the key "ssl_error" to indicate this specific issue. In the future, we could enhance this by providing 
                 # more detailed error messages based on the specific SSL error encountered.
                 errors["base"] = "ssl_error"
-            except Exception:
-                # Any other exception (e.g., network error, timeout) is treated as a connection issue. We add an error with the key
-                # "cannot_connect".
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                # Network-level errors and timeouts are treated as a connection issue. We deliberately do not catch Exception here:
+                # programming errors should surface in the log, and CancelledError must propagate so flow teardown on HA shutdown is
+                # immediate instead of waiting out the probe timeout.
                 errors["base"] = "cannot_connect"
 
-        # Build the Voluptuous schema that describes the form fields. vol.Required means the user must provide a value. vol.Optional 
-        # means the field has a sensible default and can be left alone.
-        data_schema = vol.Schema({
-            vol.Required(CONF_URL): str,
-            vol.Required(CONF_TOKEN_ID): str,
-            vol.Required(CONF_TOKEN_SECRET): str,
-            vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): int,
-            vol.Optional(CONF_PER_SHELF_ENABLED, default=True): bool,
-            vol.Optional(CONF_VERIFY_SSL, default=DEFAULT_VERIFY_SSL): bool,
-        })
-
-        # Render the form to the user. If there were validation errors, they will be displayed on the form. The data_schema defines the 
-        # fields that the user needs to fill out.  
+        # Render the form to the user. If there were validation errors, they will be displayed on the form. The module-level
+        # _USER_SCHEMA defines the fields that the user needs to fill out (vol.Required means the user must provide a value,
+        # vol.Optional means the field has a sensible default and can be left alone).
         return self.async_show_form(
             step_id="user", # The step_id "user" indicates that this is the initial step of the config flow.
-            data_schema=data_schema,
+            data_schema=_USER_SCHEMA,
             errors=errors,
             # The description_placeholders can be used to provide additional context or instructions for the user, which can be helpful 
             # for fields that might be confusing. In this case, we don't have any placeholders, but we could add some in the future if 
@@ -160,7 +285,7 @@ class BookStackConfigFlow(config_entries.ConfigFlow, domain=DOMAIN): # type: ign
 
         if user_input is not None:
             try:
-                if await self._validate_input(user_input):
+                if await _validate_input(self.hass, user_input):
                     return self.async_update_reload_and_abort(
                         reconfigure_entry,
                         data_updates={
@@ -176,7 +301,7 @@ class BookStackConfigFlow(config_entries.ConfigFlow, domain=DOMAIN): # type: ign
                 errors["base"] = "invalid_auth"
             except aiohttp.ClientSSLError:
                 errors["base"] = "ssl_error"
-            except Exception:
+            except (aiohttp.ClientError, asyncio.TimeoutError):
                 errors["base"] = "cannot_connect"
 
         data_schema = vol.Schema(
@@ -226,9 +351,12 @@ class BookStackConfigFlow(config_entries.ConfigFlow, domain=DOMAIN): # type: ign
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            new_data = {**self._reauth_entry.data, **user_input}
+            # entry.data is a read-only mapping proxy; copy it into a real dict and update in place rather than the {**a, **b} spread,
+            # which allocates and resizes an intermediate map.
+            new_data = dict(self._reauth_entry.data)
+            new_data.update(user_input)
             try:
-                if await self._validate_input(new_data):
+                if await _validate_input(self.hass, new_data):
                     # If validation is successful, we update the existing config entry with the new credentials.
                     self.hass.config_entries.async_update_entry(
                         self._reauth_entry, data=new_data
@@ -247,72 +375,30 @@ class BookStackConfigFlow(config_entries.ConfigFlow, domain=DOMAIN): # type: ign
                 errors["base"] = "invalid_auth"
             except aiohttp.ClientSSLError:
                 errors["base"] = "ssl_error"
-            except Exception:
+            except (aiohttp.ClientError, asyncio.TimeoutError):
                 errors["base"] = "cannot_connect"
 
-        # The minimal form for re-authentication only includes the token ID and secret, since the URL is needed to validate the 
-        # credentials and is not expected to change.
-        data_schema = vol.Schema({
-            vol.Required(CONF_TOKEN_ID): str,
-            vol.Required(CONF_TOKEN_SECRET): str,
-        })
-
+        # The minimal form for re-authentication (module-level _REAUTH_SCHEMA) only includes the token ID and secret, since the URL is
+        # needed to validate the credentials and is not expected to change.
         return self.async_show_form(
             step_id="reauth_confirm",
-            data_schema=data_schema,
+            data_schema=_REAUTH_SCHEMA,
             errors=errors,
         )
 
-    async def _validate_input(self, data: dict) -> bool:
-        """Validate API credentials by calling the BookStack API
-        
-        Calls the "/api/system" endpoint which requires authentication and returns system information. If we get a successful response 
-        and can parse the expected data, we consider the credentials valid. If we get a 401 response, we raise ConfigEntryAuthFailed to 
-        indicate invalid credentials. For any other exceptions (e.g., network issues), we return False to indicate a connection problem.
-        """
-        session = async_get_clientsession(self.hass)
-        # BookStack API uses token-based authentication where the token ID and secret are combined in the Authorization header. 
-        headers = {
-            "Authorization": f"Token {data[CONF_TOKEN_ID]}:{data[CONF_TOKEN_SECRET]}"
-        }
-        # The URL for the system endpoint, using the configured base URL. We ensure there is no trailing slash on the base URL to avoid 
-        # issues with double slashes in the final URL.
-        url = f"{data[CONF_URL].rstrip('/')}/api/system"
-        # Define a short timeout so the form doesn't hang for too long if there are connection issues. 
-        timeout = aiohttp.ClientTimeout(total=10)
-        # Determine whether to verify SSL certificates. When verify_ssl is False we pass ssl=False to aiohttp, which disables
-        # certificate verification. This is useful for self-signed or internal certificates.
-        ssl = data.get(CONF_VERIFY_SSL, DEFAULT_VERIFY_SSL) or False
-
-        try:
-            async with session.get(url, headers=headers, timeout=timeout, ssl=ssl) as resp: # Make the HTTP GET request to the API
-                if resp.status == 401:
-                    # The API explicitly rejected the credentials
-                    raise ConfigEntryAuthFailed
-                if resp.status != 200:
-                    # Any other non-success status code is treated as a connection issue
-                    return False
-                # Get the response JSON and check if it contains the expected "version" field, which indicates we successfully 
-                # authenticated and got a valid response from the API.
-                json_data = await resp.json()
-                return "version" in json_data
-        except ConfigEntryAuthFailed:
-            raise # Let the caller handle this specific exception to show an "invalid_auth" error message
-        except aiohttp.ClientSSLError:
-            raise # Let the caller handle this specific exception to show an "ssl_error" error message
-        except aiohttp.ClientError:
-            # Handle any network level errors (e.g., connection refused, DNS failure) as a connection issue
-            raise Exception("cannot_connect") from aiohttp.ClientError
-
     @staticmethod
     def async_get_options_flow(
         config_entry: config_entries.ConfigEntry,
-    ) -> BookStackOptionsFlow:
+    ) -> "BookStackOptionsFlow":
         """Return the options flow handler.
         
         HA calls this when the user clicks on the "Options" button for the config entry in the HA UI. This should return an instance of 
         BookStackOptionsFlow, which handles the options editing UI defined in options_flow.py. By separating the options flow into its own 
         class, we keep the config flow focused on initial setup and credential validation, while the options flow can handle additional 
-        settings that can be changed after setup.
+        settings that can be changed after setup. The import happens here rather than at module top because HA imports config_flow.py
+        eagerly during discovery; options_flow (and everything it pulls in) only needs to load if the user actually opens Options, and
+        sys.modules makes every click after the first free.
         """
+        from .options_flow import BookStackOptionsFlow
+
         return BookStackOptionsFlow()
\ No newline at end of file
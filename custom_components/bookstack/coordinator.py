@@ -6,24 +6,120 @@ provides that data to the sensor entities. It also handles error handling and av
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import timedelta
+import random
+import time
+from datetime import datetime, timedelta
 from typing import Any
 
 import aiohttp # type: ignore
 
+from homeassistant.config_entries import ConfigEntry # type: ignore
 from homeassistant.core import HomeAssistant # type: ignore
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed # type: ignore
+from homeassistant.helpers.device_registry import DeviceInfo # type: ignore
 from homeassistant.exceptions import ConfigEntryAuthFailed # type: ignore
+from homeassistant.util import dt as dt_util # type: ignore
+from homeassistant.util.json import json_loads # type: ignore
 
 # Import constants from the const.py file
-from .const import DEFAULT_SCAN_INTERVAL, DEFAULT_VERIFY_SSL, GITHUB_LATEST_RELEASE_URL
+from .const import DOMAIN, DEFAULT_SCAN_INTERVAL, DEFAULT_VERIFY_SSL, GITHUB_LATEST_RELEASE_URL
 
 # Set up logging for the integration. This allows us to log important information and errors, which can be helpful for debugging and 
 # monitoring the integration. Using __name__ produces "custom_components.bookstack" which makes log entries easy to filter in the HA 
 # log viewer.
 _LOGGER = logging.getLogger(__name__)
 
+
+class _RetryableServerError(UpdateFailed):
+    """Internal marker for 5xx API responses, which are worth retrying before the update is failed.
+
+    Subclasses UpdateFailed so that if the retries are exhausted the exception surfaces to the DataUpdateCoordinator exactly like any
+    other failed update.
+    """
+
+
+class _RateLimitedError(_RetryableServerError):
+    """Internal marker for 429 responses, carrying the server-requested wait before the next attempt.
+
+    BookStack rate-limits API requests per user (180/min by default), so a large per-shelf fan-out can trip it even with the
+    concurrency semaphore in place. The 429 response includes a Retry-After header with the number of seconds to wait; the retry loop
+    honours it instead of using its own (much shorter) jittered backoff.
+    """
+
+    def __init__(self, message: str, retry_after: float) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def _first_exception(group: BaseExceptionGroup) -> BaseException:
+    """Return the first leaf exception inside a (possibly nested) ExceptionGroup.
+
+    asyncio.TaskGroup always wraps task failures in an ExceptionGroup; the coordinator's error handling works in terms of the
+    individual exception types (ConfigEntryAuthFailed, aiohttp.ClientError, UpdateFailed), so the first real failure is unwrapped
+    and re-raised bare.
+    """
+    exc: BaseException = group.exceptions[0]
+    while isinstance(exc, BaseExceptionGroup):
+        exc = exc.exceptions[0]
+    return exc
+
+
+def _changed_shelf_ids(
+    prev_by_id: dict[int, dict[str, Any]], shelves: list[dict[str, Any]]
+) -> frozenset[int]:
+    """Return the IDs of shelves whose counts differ from the previous snapshot.
+
+    Shelves absent from the previous snapshot (newly created) count as changed, and so do shelves absent from the new list (deleted):
+    their still-registered sensors must write one final state (counts fall back to 0) instead of freezing at the stale values. Used to
+    let per-shelf sensors skip their state write when a refresh touched other shelves but not theirs.
+    """
+    current_ids = {shelf["id"] for shelf in shelves}
+    changed = {
+        shelf["id"]
+        for shelf in shelves
+        if (prev := prev_by_id.get(shelf["id"])) is None
+        or prev["book_count"] != shelf["book_count"]
+        or prev["chapter_count"] != shelf["chapter_count"]
+        or prev["page_count"] != shelf["page_count"]
+    }
+    return frozenset(changed | (prev_by_id.keys() - current_ids))
+
+
+def _parse_page_timestamp(updated_at: str | None) -> datetime | None:
+    """Parse a BookStack updated_at string into an aware datetime in the HA local timezone.
+
+    Done once in the coordinator when the last-updated-page detail is fetched, so the timestamp sensor never has to parse on a state
+    read; an unparseable or missing value becomes None, which the sensor reports as an unknown state.
+    """
+    if not updated_at:
+        return None
+    try:
+        # fromisoformat does not accept 'Z' before Python 3.11; normalise first.
+        return dt_util.as_local(datetime.fromisoformat(updated_at.replace("Z", "+00:00")))
+    except (ValueError, AttributeError):
+        return None
+
+
+def _build_tag_payload(tags: list[dict[str, str]] | None) -> list[dict[str, str]]:
+    """Normalise user-supplied tags into the name/value dict list the BookStack API expects on write.
+
+    Strips whitespace and drops tags with a blank name (avoiding accidentally creating blank tags), computing each tag's stripped
+    name exactly once. The "value" key is always included, even when empty — that is valid in the BookStack API and displays the tag
+    as a label-style tag (name only) in the BookStack UI. Shared by the create_book, create_page and append_page actions.
+    """
+    if not tags:
+        return []
+    payload: list[dict[str, str]] = []
+    for tag in tags:
+        tag_name = (tag.get("name") or "").strip()
+        if not tag_name:
+            continue
+        payload.append({"name": tag_name, "value": (tag.get("value") or "").strip()})
+    return payload
+
+
 class BookStackCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinator to handle all communication with the BookStack API including:
         - Getting BookStack stats and per-shelf book counts at the desired interval.
@@ -36,6 +132,12 @@ class BookStackCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     We also implement an async_create_book method that can be called by the service handler when the "create_book" action is invoked. 
     """
 
+    # Timeout for all BookStack API requests, built once at class definition. The budget is granular rather than one flat total: an
+    # unreachable host fails at the 3s connect stage instead of consuming the whole budget, while a healthy-but-busy instance gets a
+    # full 10s to stream a large response within the 15s overall cap. Sharing one ClientTimeout instance also avoids reallocating the
+    # object on every poll and action call.
+    _API_TIMEOUT = aiohttp.ClientTimeout(total=15, connect=3, sock_connect=3, sock_read=10)
+
     def __init__(
         self,
         hass: HomeAssistant, # The Home Assistant instance, passed in from the async_setup_entry function in __init__.py. This allows the coordinator to interact with HA, such as scheduling updates and logging.
@@ -55,22 +157,127 @@ class BookStackCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             name="BookStack",
             update_interval=timedelta(seconds=scan_interval),
         )
-        self.session = session
+        # The passed-in shared HA session is kept for traffic to third-party hosts (the GitHub release check), where HA's default pool
+        # is the right place for the connection to live.
+        self._shared_session = session
+        # For the BookStack host itself the coordinator runs its own session on an explicitly tuned connector. With the polling
+        # fan-out, the aiohttp defaults work against us: per-host connections are effectively unbounded (we cap them to match the
+        # fan-out semaphore), the 15s keepalive lets sockets die between polls (75s keeps them warm across a typical scan interval),
+        # and each new connection re-resolves DNS (a 5-minute resolver cache avoids a getaddrinfo per reconnect). The session is
+        # closed in async_shutdown when the entry unloads.
+        # DNS caching (use_dns_cache with a 5-minute TTL) is safe here because a config entry is pinned to a single BookStack host for
+        # its whole lifetime; it saves a getaddrinfo syscall every time the pool opens a new connection.
+        self._connector = aiohttp.TCPConnector(
+            limit=32,
+            limit_per_host=8,
+            keepalive_timeout=75,
+            use_dns_cache=True,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True,
+        )
+        self.session = aiohttp.ClientSession(connector=self._connector)
         self.config = config
         self.per_shelf_enabled = per_shelf_enabled
+        # Auth header and base URL are fixed for the lifetime of the coordinator (credential changes reload the entry and build a new
+        # coordinator), so they are computed once here instead of being re-derived — dict allocation, f-string, rstrip — on every poll
+        # and every action call. _write_headers is the same header set plus Content-Type for the JSON-body POST/PUT calls.
+        self._base_url: str = config["url"].rstrip("/")
+        self._api_root: str = f"{self._base_url}/api/" # Every API URL is this root plus an endpoint, so request paths are a single concatenation.
+        self._headers: dict[str, str] = {
+            "Authorization": f"Token {config['token_id']}:{config['token_secret']}"
+        }
+        self._write_headers: dict[str, str] = {**self._headers, "Content-Type": "application/json"}
         # Determine the ssl parameter for aiohttp requests. When verify_ssl is False we pass ssl=False to skip certificate verification. 
         # When True (the default) we pass ssl=None which lets aiohttp use its default SSL context (i.e. verify certs).
         self._ssl: bool | None = None if config.get("verify_ssl", DEFAULT_VERIFY_SSL) else False
-        # Instance attributes to hold the fetched data. We initialize them to None or empty structures, and they will be populated 
-        # when _async_update_data is called.
-        self.version: str | None = None # The version of the BookStack instance, fetched from the /system endpoint.
-        self.system_data: dict[str, Any] = {} # The raw system data from the /system endpoint
-        self.shelves_data: list[dict[str, Any]] = [] # A list of per-shelf data, including book/chapter/page counts for each shelf, if per_shelf_enabled is True.
-        self.last_updated_page: dict[str, Any] = {} # Data about the most recently updated page, including its name, update time, and who updated it.
-        self.is_available: bool = False # Availability status of the coordinator, which can be used by entities to determine if they should be marked as unavailable. This is set based on whether we can successfully fetch data from the API.
-        self._was_available: bool | None = None # Track the previous availability status to log when the API goes down or comes back up.
+        # All data fetched from BookStack lives in self.data, the dict returned by _async_update_data — there are deliberately no
+        # mirror attributes (version, shelves, last-updated page, ...) alongside it. A single snapshot dict means one set of writes
+        # per poll, no way for the copies to disagree under partial failure, and readers always index into the same structure:
+        # data["version"], data["system"], data["counts"], data["shelves"], data["last_updated_page"]. Availability is likewise not
+        # tracked separately: the DataUpdateCoordinator's built-in last_update_success already flips on exactly the success/failure
+        # boundary the old flag mirrored.
         self.latest_version: str | None = None  # Latest BookStack version available on GitHub.
         self.latest_release_url: str | None = None  # GitHub release page URL for the latest version.
+        # Stale-while-revalidate bookkeeping for the per-shelf fan-out, by far the most expensive part of a poll. Shelf contents
+        # rarely change poll-to-poll, so the cached per-shelf data is served as-is while younger than the fresh TTL; between the fresh TTL
+        # and the stale TTL it is still served but a background revalidation is kicked off so the next reader sees new data; only
+        # beyond the stale TTL does the poll block on a full fan-out. Both windows scale with the configured scan interval.
+        self._shelves_fetched_at: float | None = None # monotonic timestamp of the last successful shelf fan-out; None until the first one.
+        # IDs of shelves whose counts changed in the most recent refresh (new shelves included). Per-shelf sensors consult this to
+        # skip their state write when their own shelf is untouched, so a refresh that changes one shelf doesn't rewrite them all.
+        self.changed_shelf_ids: frozenset[int] = frozenset()
+        self._shelf_total: int | None = None # Total shelf count as reported by the last shelf-list fetch; reused for the "shelves" count so polls skip the separate count probe.
+        # Per-shelf result cache: shelf_id -> (signature, chapter_count, page_count). The signature combines the shelf's updated_at
+        # with every member book's (id, updated_at) pair, so any book added, removed or edited invalidates it; while it matches, the
+        # shelf's per-book fetches are skipped entirely and the previous counts are reused.
+        self._shelf_stat_cache: dict[int, tuple[tuple, int, int]] = {}
+        # Per-book content cache: book_id -> (updated_at, chapter_count, page_count). Finer-grained than the shelf cache above: even
+        # when a shelf's signature moves (a book added or one member edited), every book whose updated_at is unchanged still serves
+        # its counts from here instead of a books/{id} fetch. The updated_at comes for free from the book summaries embedded in the
+        # shelf detail, so checking the cache costs no extra API calls.
+        self._book_cache: dict[int, tuple[str | None, int, int]] = {}
+        self._shelf_fresh_ttl: float = float(scan_interval) * 2 # Age below which cached shelf data is served without any API calls.
+        self._shelf_stale_ttl: float = float(scan_interval) * 4 # Age beyond which the poll blocks on a refresh instead of serving stale data.
+        self._shelf_selfheal_ttl: float = 3600.0 # Age at which a refresh runs even with no observed activity, catching changes (e.g. a book moved between shelves) the global change signature can't see.
+        self._shelf_refresh_task: asyncio.Task | None = None # In-flight background revalidation, if any, so only one runs at a time.
+        self._force_shelves = False # Set by the write actions before they request a refresh, so the very next poll re-counts the shelves instead of serving the (now known-stale) cache.
+        # Per-page append machinery. The lock serialises concurrent appends to the same page: two interleaved GET+PUT cycles would
+        # both read the same original content and the second PUT would silently drop the first append. The cache holds the page
+        # object our own PUT returned, so a burst of appends (automations often fire several in quick succession) costs one GET and
+        # N PUTs instead of N of each — under the lock nothing else from this integration can have touched the page in between, and
+        # the short TTL keeps the window for missing a concurrent human edit no larger than the GET->PUT gap that exists anyway.
+        # The locks dict is left unbounded: entries are a few dozen bytes and the key space is the set of pages automations write to.
+        self._append_locks: dict[int, asyncio.Lock] = {}
+        self._append_cache: dict[int, tuple[float, dict[str, Any]]] = {}
+        self._append_cache_ttl: float = 5.0 # Reuse window for a just-written page; bursts land well inside it.
+        # Last-updated-page cache: (page_id, updated_at, built dict). The list probe already identifies the most recent page; the
+        # pages/{id} detail call only exists to pull in updated_by, which cannot change without updated_at moving too. While the
+        # probe reports the same (id, updated_at) pair the previously built dict is reused and the detail round-trip is skipped —
+        # the common case on every poll of a quiet instance.
+        self._last_page_cache: tuple[int, str | None, dict[str, Any]] | None = None
+        # Adaptive polling: when consecutive polls come back identical (same counts, same last-updated page) the interval doubles, up
+        # to 4x the configured value, so quiet instances get polled less; the first observed change snaps it straight back to the
+        # configured interval. Assigning self.update_interval reschedules the next refresh automatically.
+        self._base_interval = timedelta(seconds=scan_interval)
+        self._max_interval = timedelta(seconds=scan_interval * 4)
+        self._last_data_signature: tuple | None = None # Signature of the previous poll's data, for change detection.
+        # Failure backoff: while polls keep failing the interval doubles per consecutive failure, up to 8x the configured value, so
+        # an extended outage doesn't burn a full-timeout request (and a warning-level retry cycle) every scan interval. The first
+        # successful poll resets the counter, and the success-path logic above restores the interval.
+        self._consecutive_failures = 0
+        self._failure_max_interval = timedelta(seconds=scan_interval * 8)
+        # Conditional-GET cache: endpoint -> (etag, parsed body). When BookStack (or a fronting proxy) returns an ETag, the next
+        # request for the same endpoint sends If-None-Match and a 304 answer is satisfied from the cached body — the server skips
+        # rendering the response and we skip downloading and parsing it. Endpoints without ETags simply never populate the cache.
+        self._etag_cache: dict[str, tuple[str, Any]] = {}
+        # Single-flight guard: an options-change (or service-triggered) async_refresh can fire while a scheduled poll is already
+        # mid-flight. The lock serialises the two update bodies so they can't interleave their writes; combined with the publish-at-
+        # the-end pattern in _async_update_data, entities never observe a half-written mix of old and new state.
+        self._update_lock = asyncio.Lock()
+        self._device_info_cache: DeviceInfo | None = None  # Shared DeviceInfo handed out to every entity; built lazily on first access.
+
+    async def async_shutdown(self) -> None:
+        """Shut down the coordinator, closing the dedicated BookStack session (and with it the tuned connector)."""
+        await super().async_shutdown()
+        await self.session.close()
+
+    def device_info(self, entry: ConfigEntry) -> DeviceInfo:
+        """Return the shared DeviceInfo for all entities belonging to this config entry.
+
+        Every entity in the integration lives on the same device (the BookStack instance), so the DeviceInfo dict is built once on
+        first access and the same reference is handed to every entity rather than rebuilding an identical dict per entity. DeviceInfo
+        is treated as immutable by HA, so sharing the reference is safe.
+        """
+        if self._device_info_cache is None:
+            self._device_info_cache = DeviceInfo(
+                identifiers={(DOMAIN, entry.entry_id)},
+                name=f"BookStack ({entry.data['url']})",
+                manufacturer="BookStack",
+                model="BookStack",
+                sw_version=(self.data or {}).get("version"),
+                configuration_url=entry.data["url"],
+            )
+        return self._device_info_cache
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from BookStack API
@@ -80,165 +287,505 @@ class BookStackCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         available to entities. If there is an error, it should raise an UpdateFailed exception.
         """
 
-        # Build the headers for authentication using the token ID and secret from the config.
-        headers = {
-            "Authorization": f"Token {self.config['token_id']}:{self.config['token_secret']}"
-        }
-        # Get the base URL from the config and ensure it does not end with a slash, as we'll be appending endpoints to it.
-        base_url = self.config["url"].rstrip("/")
-        # Set a reasonable timeout (10 seconds) for API requests to avoid hanging if the API is unresponsive.
-        timeout = aiohttp.ClientTimeout(total=10)
+        # Single-flight: serialise the whole fetch-and-publish body under the update lock. A manual async_refresh (options
+        # change, service call) arriving while a scheduled poll is in flight simply waits its turn instead of racing the same
+        # attribute writes; by the time it runs, the fresh data is usually already there and its own fetches hit the caches.
+        async with self._update_lock:
+            # The auth headers and base URL are precomputed in __init__ (they never change for the lifetime of this coordinator).
+            headers = self._headers
+            base_url = self._base_url
+            api_root = self._api_root
+            # The shared class-level timeout keeps requests from hanging if the API is unresponsive (see _API_TIMEOUT for the split).
+            timeout = self._API_TIMEOUT
+
+            async def get_json(endpoint: str) -> dict[str, Any]:
+                """Helper function to make authenticated GET requests to the API and return the JSON response. Centralises the logic and
+                error handling for API requests, including the conditional-GET (ETag/If-None-Match) layer and bounded retry.
+
+                Transient failures — connection errors, timeouts, 429 rate limits, and 5xx responses — are retried up to two more times
+                with short jittered exponential backoff (or the server's Retry-After for a 429), so a single blip doesn't abort the
+                whole poll and force the next interval to redo all the work. Authentication failures (401) and other 4xx responses are
+                never retried: they are deterministic and retrying would only delay the error.
+                """
+                # Callers pass endpoints without a leading slash, so the URL is one concatenation with the precomputed root.
+                url = api_root + endpoint
+                # If a previous response for this endpoint carried an ETag, revalidate instead of refetching: the server answers 304
+                # with no body when nothing changed, and the cached parsed body is returned directly.
+                cached = self._etag_cache.get(endpoint)
+                if cached is not None:
+                    req_headers = dict(headers)
+                    req_headers["If-None-Match"] = cached[0]
+                else:
+                    req_headers = headers
+
+                attempts = 3
+                for attempt in range(attempts):
+                    try:
+                        async with self.session.get(url, headers=req_headers, timeout=timeout, ssl=self._ssl) as resp:
+                            if resp.status == 304:
+                                return cached[1] # Unchanged on the server — reuse the cached body without downloading or parsing anything.
+                            if resp.status == 401:
+                                raise ConfigEntryAuthFailed("Invalid API credentials")
+                            if resp.status == 429:
+                                # Rate-limited: BookStack tells us how long to wait via Retry-After. Treated as retryable so a brief
+                                # throttle during the fan-out slows the poll down rather than failing it outright.
+                                try:
+                                    retry_after = float(resp.headers.get("Retry-After", 1))
+                                except ValueError:
+                                    retry_after = 1.0
+                                raise _RateLimitedError(f"Rate limited on {endpoint}", retry_after)
+                            if resp.status >= 500:
+                                # Server-side errors are frequently transient (restart, proxy hiccup) — retry before giving up.
+                                raise _RetryableServerError(f"API error {resp.status} for {endpoint}")
+                            if resp.status != 200:
+                                raise UpdateFailed(f"API error {resp.status} for {endpoint}")
+                            # Read the raw bytes and parse with HA's orjson-backed json_loads instead of resp.json(): the stdlib
+                            # parser is several times slower, and skipping resp.json() also skips its Content-Type sniffing. This is
+                            # CPU work on the event loop, so it adds up when dozens of book details arrive through the fan-out.
+                            body = json_loads(await resp.read())
+                            etag = resp.headers.get("ETag")
+                            if etag:
+                                # Keep the cache bounded on instances with huge, churning libraries; a rare full reset is cheaper than an LRU.
+                                if len(self._etag_cache) > 1024:
+                                    self._etag_cache.clear()
+                                self._etag_cache[endpoint] = (etag, body)
+                            return body
+                    except (_RetryableServerError, aiohttp.ClientError, asyncio.TimeoutError) as err:
+                        if attempt == attempts - 1:
+                            raise
+                        # A 429 carries the server's own wait; otherwise use our short backoff. Capped so a hostile/buggy
+                        # Retry-After can't stall the poll past the coordinator's own timeout budget.
+                        if isinstance(err, _RateLimitedError):
+                            await asyncio.sleep(min(err.retry_after, 30.0))
+                            continue
+                    # Exponential backoff with jitter (~0.25s, ~0.5s) so concurrent fan-out requests don't retry in lockstep.
+                    await asyncio.sleep(0.25 * (2 ** attempt) * (0.5 + random.random()))
+                raise UpdateFailed(f"Retries exhausted for {endpoint}") # Unreachable; keeps the function's return type honest.
+
+            async def count(endpoint: str) -> int:
+                """Helper function to get the total count of items for a given endpoint. Many BookStack API endpoints support a "count" 
+                parameter that returns the total number of items, which is more efficient than fetching all items when we only need the 
+                count."""
+                data = await get_json(f"{endpoint}?count=1")
+                return int(data.get("total", 0))
+
+            # Get all the data we need for the sensors
+            try:
+                # All of the independent requests — the system info, the seven standard counts, and the most-recently-updated-page probe —
+                # are fired concurrently rather than awaited one after another. Sequentially each request costs a full round-trip, so a
+                # poll paid ~9 RTTs before any per-shelf work; concurrently the wall-clock cost is roughly the slowest single request.
+                # A TaskGroup (rather than gather) provides structured cancellation: the first failure — most importantly a 401 raising
+                # ConfigEntryAuthFailed — cancels the sibling requests immediately instead of letting all nine run to completion before
+                # the error surfaces, so a dead or misconfigured server isn't hammered with doomed requests every poll.
+
+                async def shelf_total() -> int:
+                    """Return the shelf total, reusing the total reported by the last shelf-list fetch when per-shelf polling runs.
+
+                    The shelf-list response already carries the authoritative total, so when that data exists the dedicated
+                    shelves?count=1 probe is a wasted round-trip; it is only issued when per-shelf polling is disabled (or hasn't run
+                    yet) and no reported total is available.
+                    """
+                    if self.per_shelf_enabled and self._shelf_total is not None:
+                        return self._shelf_total
+                    return await count("shelves")
+
+                try:
+                    async with asyncio.TaskGroup() as tg:
+                        t_system = tg.create_task(get_json("system")) # System info - Gives us the BookStack version and checks the connection/authentication.
+                        t_shelves = tg.create_task(shelf_total())
+                        t_books = tg.create_task(count("books"))
+                        t_chapters = tg.create_task(count("chapters"))
+                        t_pages = tg.create_task(count("pages"))
+                        t_users = tg.create_task(count("users"))
+                        t_images = tg.create_task(count("image-gallery"))
+                        t_attachments = tg.create_task(count("attachments"))
+                        t_last_page = tg.create_task(get_json("pages?sort=-updated_at&count=1")) # The single most recently updated page (sorted by updated_at descending).
+                except BaseExceptionGroup as eg:
+                    # The TaskGroup wraps whatever its tasks raised in an ExceptionGroup; re-raise the first leaf bare so the
+                    # except blocks below (and HA's reauth handling for ConfigEntryAuthFailed) see the same exception types they
+                    # did when this was a gather.
+                    raise _first_exception(eg) from eg
+
+                system_data = t_system.result()
+                shelves_count = t_shelves.result()
+                books_count = t_books.result()
+                chapters_count = t_chapters.result()
+                pages_count = t_pages.result()
+                users_count = t_users.result()
+                images_count = t_images.result()
+                attachments_count = t_attachments.result()
+                pages_response = t_last_page.result()
+                version = system_data.get("version", "Unknown")
+
+                # Fetch the latest BookStack release from GitHub to power the update entity. This is done on every coordinator poll so update
+                # notifications appear promptly. Failures are logged but do not affect coordinator availability or sensor data.
+                await self._async_fetch_latest_github_release()
+
+                # Standard counts - the totals of shelves, books, chapters, pages, users, images, and attachments fetched via the count
+                # helper above. This is efficient as it avoids fetching all items when we only need the count.
+                counts: dict[str, int] = {
+                    "shelves": shelves_count,
+                    "books": books_count,
+                    "chapters": chapters_count,
+                    "pages": pages_count,
+                    "users": users_count,
+                    "images": images_count,
+                    "attachments": attachments_count,
+                }
 
-        async def get_json(endpoint: str) -> dict[str, Any]:
-            """Helper function to make authenticated GET requests to the API and return the JSON response. Centralises the logic and 
-            error handling for API requests."""
-            url = f"{base_url}/api/{endpoint.lstrip('/')}"
-            async with self.session.get(url, headers=headers, timeout=timeout, ssl=self._ssl) as resp:
-                if resp.status == 401:
-                    raise ConfigEntryAuthFailed("Invalid API credentials")
-                if resp.status != 200:
-                    raise UpdateFailed(f"API error {resp.status} for {endpoint}")
-                return await resp.json()
-
-        async def count(endpoint: str) -> int:
-            """Helper function to get the total count of items for a given endpoint. Many BookStack API endpoints support a "count" 
-            parameter that returns the total number of items, which is more efficient than fetching all items when we only need the 
-            count."""
-            data = await get_json(f"{endpoint}?count=1")
-            return int(data.get("total", 0))
-
-        async def get_all_shelves() -> list[dict[str, Any]]:
-            """Helper function to get a list of all shelves with their IDs and names. The /shelves endpoint is paginated, so we need to 
-            loop through pages until we get all shelves. We use this information to create per-shelf sensors if that option is enabled."""
-            all_shelves: list[dict[str, Any]] = []
-            offset = 0
-            page_size = 100 # BookStack has a max page size of 100, so we fetch in batches of 100 until we have all shelves.
-            while True:
-                response = await get_json(f"shelves?count={page_size}&offset={offset}")
-                batch = response.get("data", [])
-                all_shelves.extend(batch)
-                # Stop if we've fetched all shelves (compared to the total count reported by the API)
-                if len(all_shelves) >= response.get("total", 0) or not batch:
-                    break
-                offset += page_size
-            return all_shelves
-
-        # Get all the data we need for the sensors
+                # Last updated page - We fetch the details of the most recently updated page (found by the probe in the gather above) to
+                # get information about who updated it and when, which we can use for a "last updated page" sensor.
+                pages_list = pages_response.get("data", [])
+                if pages_list:
+                    probe = pages_list[0]
+                    cached_page = self._last_page_cache
+                    if (
+                        cached_page is not None
+                        and cached_page[0] == probe["id"]
+                        and cached_page[1] == probe.get("updated_at")
+                    ):
+                        # Same page, same edit timestamp — the detail (and the dict built from it) cannot have changed, so the
+                        # pages/{id} round-trip is skipped and the cached dict is reused.
+                        last_updated_page = cached_page[2]
+                    else:
+                        page_detail = await get_json(f"pages/{probe['id']}") # Fetch the page details to get the updated_by information, which is not included in the list response.
+                        updated_by = page_detail.get("updated_by") or {} # Handle the case where the updated_by can be null if the user account was deleted in BookStack.
+                        last_updated_page = {
+                            "id": page_detail.get("id"),
+                            "name": page_detail.get("name"),
+                            "updated_at": page_detail.get("updated_at"),
+                            # Pre-parsed, localised form of updated_at for the timestamp sensor. Parsing here means it happens once
+                            # per page edit (this dict is cached and reused until the page changes again) rather than on every read.
+                            "updated_dt": _parse_page_timestamp(page_detail.get("updated_at")),
+                            "updated_by_name": updated_by.get("name"),
+                            "updated_by_id": updated_by.get("id"),
+                            # Construct a URL to the page in BookStack using the book ID and page slug, which can be used in the sensor's
+                            # extra attributes to provide a direct link to the page.
+                            "url": (
+                                f"{base_url}/books/{page_detail.get('book_id')}"
+                                f"/page/{page_detail.get('slug', '')}"
+                            ),
+                        }
+                        # Key the cache by the probe's view of the page (that is what the comparison above sees next poll).
+                        self._last_page_cache = (probe["id"], probe.get("updated_at"), last_updated_page)
+                else:
+                    last_updated_page = {} # Handle the case where there are no pages in BookStack yet.
+
+                # Per-shelf sensors (Optional) - If the user has enabled per-shelf sensors, we need the book/chapter/page counts of every
+                # shelf, which requires a fan-out of API calls (see _async_fetch_shelves). Because shelf contents rarely change between
+                # polls, the fan-out runs under a stale-while-revalidate policy: cached per-shelf data younger than the fresh TTL is served
+                # with zero API calls; between the fresh and stale TTLs the cached data is still served but a background revalidation is
+                # started so new data arrives shortly after; only a cache older than the stale TTL (or no cache at all) blocks the poll on
+                # a full fan-out.
+                #
+                # On top of the TTLs sits an activity gate: the poll's change signature (the global counts plus the newest page's
+                # updated_at, also used for adaptive polling below) is a cheap proxy for "anything happened at all". While it is
+                # unchanged, even a stale cache keeps being served and no revalidation is scheduled — a quiet wiki costs zero shelf
+                # requests per poll. The gate can't see a book merely moving between shelves, so once the cache is an hour old a
+                # revalidation runs regardless, self-healing anything the signature missed.
+                signature = (tuple(sorted(counts.items())), last_updated_page.get("updated_at"))
+                activity = signature != self._last_data_signature
+
+                new_shelves = (self.data or {}).get("shelves", []) # Default: keep serving the cached per-shelf data.
+                if self.per_shelf_enabled: # Only fetch this data if the option is enabled, as it requires multiple API calls and can be slow if there are many shelves.
+                    now = time.monotonic()
+                    age = None if self._shelves_fetched_at is None else now - self._shelves_fetched_at
+                    if age is None or self._force_shelves or (
+                        age >= self._shelf_stale_ttl
+                        and (activity or age >= self._shelf_selfheal_ttl)
+                    ):
+                        # No usable cache (first poll), a write action just changed the library, or the data is too old to serve and
+                        # something actually changed — fetch inline.
+                        new_shelves = await self._async_fetch_shelves(get_json)
+                        self._shelves_fetched_at = time.monotonic()
+                        self._force_shelves = False
+                    elif activity and age >= self._shelf_fresh_ttl and (
+                        self._shelf_refresh_task is None or self._shelf_refresh_task.done()
+                    ):
+                        # Serve the cached data now and revalidate in the background (at most one revalidation in flight).
+                        self._shelf_refresh_task = self.hass.async_create_background_task(
+                            self._async_revalidate_shelves(get_json),
+                            name="bookstack_shelves_revalidate",
+                        )
+                    # else: the cache is fresh, or nothing changed anywhere — the cached per-shelf data is served as-is without
+                    # touching the API.
+                else:
+                    new_shelves = []
+
+                # Log when the API comes back online after being unavailable. last_update_success still holds the previous poll's
+                # outcome at this point (the coordinator updates it after this method returns), so it doubles as the transition flag.
+                if not self.last_update_success:
+                    _LOGGER.info("BookStack at %s is back online", base_url)
+                # A successful poll ends any failure backoff; the adaptive-interval logic below then picks the right interval.
+                self._consecutive_failures = 0
+
+                # Adaptive polling: compare this poll's counts plus the last-updated-page timestamp against the previous poll. On a
+                # quiet instance the interval backs off (doubling up to 4x the configured value); any observed change resets it to the
+                # configured interval so activity is tracked at full resolution again. The signature itself is computed above, where
+                # it also gates the per-shelf revalidation.
+                if signature == self._last_data_signature:
+                    current = self.update_interval or self._base_interval
+                    backed_off = min(current * 2, self._max_interval)
+                    if backed_off != current:
+                        _LOGGER.debug(
+                            "No changes detected; backing polling interval off to %s", backed_off
+                        )
+                    self.update_interval = backed_off
+                elif self.update_interval != self._base_interval:
+                    _LOGGER.debug(
+                        "Change detected; restoring polling interval to %s", self._base_interval
+                    )
+                    self.update_interval = self._base_interval
+                self._last_data_signature = signature
+
+                # Return everything the poll produced as one snapshot dict; the coordinator stores it as self.data, which is the
+                # single place entities, actions and diagnostics read from. Building the whole dict here (rather than mirroring
+                # pieces onto attributes as they arrive) means the published state is always internally consistent: a failed poll
+                # raises before this return and self.data keeps the previous complete snapshot.
+                # Index the shelves by ID alongside the list: every per-shelf sensor looks its own shelf up on each state write, and
+                # the dict turns that from a linear scan per sensor (quadratic in shelf count across all sensors) into a single
+                # lookup. When the cached shelf list is being served unchanged the previous index is reused by identity instead of
+                # being rebuilt.
+                prev_snapshot = self.data or {}
+                if new_shelves is prev_snapshot.get("shelves"):
+                    shelves_by_id = prev_snapshot.get("shelves_by_id", {})
+                    self.changed_shelf_ids = frozenset() # Cache served unchanged — by definition no shelf moved.
+                else:
+                    shelves_by_id = {s["id"]: s for s in new_shelves}
+                    self.changed_shelf_ids = _changed_shelf_ids(
+                        prev_snapshot.get("shelves_by_id", {}), new_shelves
+                    )
+
+                return {
+                    "counts": counts,
+                    "version": version,
+                    "system": system_data,
+                    "shelves": new_shelves,
+                    "shelves_by_id": shelves_by_id,
+                    "last_updated_page": last_updated_page,
+                }
+
+            # An authentication failure (ConfigEntryAuthFailed from get_json) propagates untouched: HA flags the entry for
+            # reauthentication and stops polling pending user action, so neither bookkeeping nor backoff applies to it.
+            except UpdateFailed:
+                # A non-network failure (unexpected status, retries exhausted on 5xx) — back the polling interval off and let the
+                # coordinator record the failure.
+                self._backoff_on_failure()
+                raise
+            except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+                # Network error (e.g., connection refused, DNS failure) or a timed-out request (a black-holed server exhausts the
+                # retry loop and re-raises TimeoutError bare) — log once when the connection is first lost, then keep retrying in
+                # case the outage is temporary. last_update_success still reflects the previous poll here, so it serves as the edge
+                # detector. The config flow treats the same pair of exceptions as "cannot connect".
+                if self.last_update_success:
+                    _LOGGER.warning(
+                        "BookStack at %s is unavailable: %s", base_url, err
+                    )
+                self._backoff_on_failure()
+                # Wrap the original exception in an UpdateFailed to signal to the DataUpdateCoordinator that the update failed due to a
+                # connection issue. This will trigger the retry logic based on the update interval.
+                raise UpdateFailed(f"Connection error: {err}") from err
+
+    def _backoff_on_failure(self) -> None:
+        """Back the polling interval off after a failed poll.
+
+        Each consecutive failure doubles the interval, capped at 8x the configured value, so an extended outage doesn't burn a
+        full-timeout request every scan interval. Called from the failure paths of _async_update_data; the success path resets the
+        counter and the adaptive-interval logic restores the interval. Assigning update_interval reschedules the next refresh.
+        """
+        self._consecutive_failures += 1
+        backed_off = min(
+            self._base_interval * (2 ** self._consecutive_failures), self._failure_max_interval
+        )
+        if backed_off != self.update_interval:
+            _LOGGER.debug(
+                "Poll failed (%d consecutive); backing polling interval off to %s",
+                self._consecutive_failures, backed_off,
+            )
+        self.update_interval = backed_off
+
+    async def _async_fetch_shelves(self, get_json) -> list[dict[str, Any]]:
+        """Fetch per-shelf book/chapter/page counts via a bounded concurrent fan-out.
+
+        The API does not provide aggregated counts for shelves, so we fetch the details of each shelf to get its books, and then for
+        each book fetch its contents to count chapters and pages. Both levels fan out concurrently, bounded by a semaphore so a large
+        library doesn't open dozens of simultaneous connections against the BookStack server. The get_json helper is supplied by the
+        caller so the same request plumbing (auth, timeout, error mapping) is used whether this runs inline in a poll or as a
+        background revalidation.
+
+        Each fan-out stage runs under an asyncio.TaskGroup: if one fetch fails (a 500 after retries, or ConfigEntryAuthFailed) the
+        siblings are cancelled immediately instead of being left to finish against a server we already know is unhappy, and nothing
+        leaks past the block. The resulting ExceptionGroup is unwrapped to the first real failure so callers keep seeing the same
+        exception types as before.
+        """
+        # The /shelves list endpoint is paginated; the first page's response includes the total, so after one probe every remaining
+        # page is fetched concurrently rather than walking offsets one round-trip at a time.
+        page_size = 100 # BookStack has a max page size of 100, so we fetch in batches of 100 until we have all shelves.
+        first = await get_json(f"shelves?count={page_size}&offset=0")
+        shelf_summaries: list[dict[str, Any]] = list(first.get("data", []))
+        total = first.get("total", 0)
+        # Remember the reported total so subsequent polls can answer the "shelves" count from here instead of a dedicated count probe.
+        self._shelf_total = int(total)
+        if len(shelf_summaries) < total and shelf_summaries:
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    page_tasks = [
+                        tg.create_task(get_json(f"shelves?count={page_size}&offset={offset}"))
+                        for offset in range(page_size, total, page_size)
+                    ]
+            except BaseExceptionGroup as eg:
+                raise _first_exception(eg) from eg
+            for page_task in page_tasks:
+                shelf_summaries.extend(page_task.result().get("data", []))
+
+        sem = asyncio.Semaphore(8)
+
+        async def bounded(endpoint: str) -> dict[str, Any]:
+            """Fetch one endpoint while holding a semaphore slot, capping in-flight requests."""
+            async with sem:
+                return await get_json(endpoint)
+
+        # First level: every shelf detail in parallel.
         try:
-            # System info - Gives us the BookStack version and checks the connection/authentication.
-            self.system_data = await get_json("system")
-            self.version = self.system_data.get("version", "Unknown")
-
-            # Fetch the latest BookStack release from GitHub to power the update entity. This is done on every coordinator poll so update 
-            # notifications appear promptly. Failures are logged but do not affect coordinator availability or sensor data.
-            await self._async_fetch_latest_github_release()
-
-            # Standard counts - Fetches the total counts of shelves, books, chapters, pages, users, images, and attachments using the 
-            # count helper function. This is efficient as it avoids fetching all items when we only need the count.
-            data: dict[str, Any] = {
-                "shelves": await count("shelves"),
-                "books": await count("books"),
-                "chapters": await count("chapters"),
-                "pages": await count("pages"),
-                "users": await count("users"),
-                "images": await count("image-gallery"),
-                "attachments": await count("attachments",)
+            async with asyncio.TaskGroup() as tg:
+                detail_tasks = [tg.create_task(bounded(f"shelves/{s['id']}")) for s in shelf_summaries]
+        except BaseExceptionGroup as eg:
+            raise _first_exception(eg) from eg
+        shelf_details = [detail_task.result() for detail_task in detail_tasks]
+
+        # Work out which shelves actually need their books re-counted. A shelf's signature (its own updated_at plus every member
+        # book's id/updated_at pair) only moves when something inside it changed; shelves whose signature matches the cache reuse the
+        # previous counts and contribute no book fetches at all, so on the common idle poll the second-level fan-out collapses to
+        # nothing.
+        shelf_signatures: list[tuple] = []
+        unchanged: dict[int, tuple[int, int]] = {} # shelf_idx -> cached (chapter_count, page_count)
+        for shelf_idx, (shelf_summary, shelf_detail) in enumerate(zip(shelf_summaries, shelf_details)):
+            signature = (
+                shelf_detail.get("updated_at"),
+                tuple((b["id"], b.get("updated_at")) for b in shelf_detail.get("books", [])),
+            )
+            shelf_signatures.append(signature)
+            cached = self._shelf_stat_cache.get(shelf_summary["id"])
+            if cached is not None and cached[0] == signature:
+                unchanged[shelf_idx] = (cached[1], cached[2])
+
+        # Second level: walk every (shelf index, book summary) pair for the changed shelves. Books whose embedded updated_at still
+        # matches the per-book cache reuse their previous counts outright; only the genuinely new/edited books are flattened into
+        # book_refs, so all remaining book probes go through a single bounded fan-out rather than one per shelf.
+        chapter_counts = [0] * len(shelf_summaries)
+        page_counts = [0] * len(shelf_summaries)
+        for shelf_idx, (cached_chapters, cached_pages) in unchanged.items():
+            chapter_counts[shelf_idx] = cached_chapters
+            page_counts[shelf_idx] = cached_pages
+        book_refs: list[tuple[int, dict[str, Any]]] = []
+        for shelf_idx, shelf_detail in enumerate(shelf_details):
+            if shelf_idx in unchanged:
+                continue
+            for book in shelf_detail.get("books", []):
+                cached_book = self._book_cache.get(book["id"])
+                if cached_book is not None and cached_book[0] == book.get("updated_at"):
+                    chapter_counts[shelf_idx] += cached_book[1]
+                    page_counts[shelf_idx] += cached_book[2]
+                else:
+                    book_refs.append((shelf_idx, book))
+
+        async def fetch_book_counts(book_id: int) -> tuple[int, int]:
+            """Return (chapter_count, page_count) for one book via two filtered count probes.
+
+            The chapters and pages list endpoints accept filter[book_id], and with count=1 their envelopes carry the authoritative
+            totals — a page nested in a chapter still belongs to the book, so the pages total matches the old walk over the full
+            contents tree. Two ~100-byte probes replace downloading the book's entire contents tree (tens of KB on a big book) just
+            to count its entries, and drop the Python traversal entirely.
+            """
+            chapters_resp, pages_resp = await asyncio.gather(
+                bounded(f"chapters?count=1&filter[book_id]={book_id}"),
+                bounded(f"pages?count=1&filter[book_id]={book_id}"),
+            )
+            return int(chapters_resp.get("total", 0)), int(pages_resp.get("total", 0))
+
+        try:
+            async with asyncio.TaskGroup() as tg:
+                count_tasks = [tg.create_task(fetch_book_counts(book["id"])) for _, book in book_refs]
+        except BaseExceptionGroup as eg:
+            raise _first_exception(eg) from eg
+        book_counts = [count_task.result() for count_task in count_tasks]
+
+        # Accumulate the per-book results onto their shelf, and store each under the updated_at from the shelf's embedded summary so
+        # the next poll serves it from the book cache.
+        for (shelf_idx, book), (book_chapters, book_pages) in zip(book_refs, book_counts):
+            chapter_counts[shelf_idx] += book_chapters
+            page_counts[shelf_idx] += book_pages
+            self._book_cache[book["id"]] = (book.get("updated_at"), book_chapters, book_pages)
+
+        # Drop cache entries for books no longer shelved anywhere so deletions don't grow the cache without bound.
+        shelved_book_ids = {
+            book["id"]
+            for shelf_detail in shelf_details
+            for book in shelf_detail.get("books", [])
+        }
+        if len(self._book_cache) > len(shelved_book_ids):
+            self._book_cache = {
+                book_id: entry
+                for book_id, entry in self._book_cache.items()
+                if book_id in shelved_book_ids
             }
 
-            # Last updated page - Fetches the single most recently updated page by sorting the /pages endpoint by updated_at in 
-            # descending order and taking only the first result. Then we fetch the details of that page to get information about who 
-            # updated it and when, which we can use for a "last updated page" sensor.
-            pages_response = await get_json("pages?sort=-updated_at&count=1")
-            pages_list = pages_response.get("data", [])
-            if pages_list:
-                page_detail = await get_json(f"pages/{pages_list[0]['id']}") # Fetch the page details to get the updated_by information, which is not included in the list response.
-                updated_by = page_detail.get("updated_by") or {} # Handle the case where the updated_by can be null if the user account was deleted in BookStack.
-                self.last_updated_page = {
-                    "id": page_detail.get("id"),
-                    "name": page_detail.get("name"),
-                    "updated_at": page_detail.get("updated_at"),
-                    "updated_by_name": updated_by.get("name"),
-                    "updated_by_id": updated_by.get("id"),
-                    # Construct a URL to the page in BookStack using the book ID and page slug, which can be used in the sensor's 
-                    # extra attributes to provide a direct link to the page.
-                    "url": (
-                        f"{base_url}/books/{page_detail.get('book_id')}"
-                        f"/page/{page_detail.get('slug', '')}"
-                    ),
-                }
-            else:
-                self.last_updated_page = {} # Handle the case where there are no pages in BookStack yet.
-
-            # Per-shelf sensors (Optional) - If the user has enabled per-shelf sensors, we need to fetch the list of shelves and then 
-            # for each shelf, fetch the book/chapter/page counts. This is more complex because the API does not provide aggregated 
-            # counts for shelves, so we need to fetch the contents of each shelf and count the books, chapters, and pages ourselves. We 
-            # also need to handle pagination for the shelves list if there are many shelves. We store the results in self.shelves_data, 
-            # which will be used by the per-shelf sensor entities. 
-            self.shelves_data = []
-            if self.per_shelf_enabled: # Only fetch this data if the option is enabled, as it requires multiple API calls and can be slow if there are many shelves.
-                shelf_summaries = await get_all_shelves()
-                shelves = []
-                for shelf_summary in shelf_summaries:
-                    # The shelves endpoint does not provide book/chapter/page counts, so we need to fetch the details of each shelf to 
-                    # get its books, and then for each book, we need to fetch its contents to count chapters and pages. 
-                    shelf_detail = await get_json(f"shelves/{shelf_summary['id']}")
-                    books = shelf_detail.get("books", [])
-
-                    chapter_count = 0
-                    page_count = 0
-                    for book in books:
-                        # Fetch the book's content which lists all of the chapters and top-level pages within the book.
-                        book_detail = await get_json(f"books/{book['id']}")
-                        # Firstly count the top-level chapters and pages directly under the book.
-                        for item in book_detail.get("contents", []):
-                            if item.get("type") == "chapter":
-                                chapter_count += 1
-                            elif item.get("type") == "page":
-                                page_count += 1
-                        # Then we need to loop through the chapters to count the pages within them.
-                        for item in book_detail.get("contents", []):
-                            if item.get("type") == "chapter":
-                                page_count += len(item.get("pages", []))
-
-                    shelves.append({
-                        "id": shelf_summary["id"],
-                        "name": shelf_summary["name"],
-                        "book_count": len(books),
-                        "chapter_count": chapter_count,
-                        "page_count": page_count,
-                    })
-                self.shelves_data = shelves
-
-            # If all API calls were successful, we can mark the coordinator as available.
-            self.is_available = True
-            # Log when the API comes back online after being unavailable.
-            if self._was_available is False:
-                _LOGGER.info("BookStack at %s is back online", base_url)
-            self._was_available = True
-            # Return all of the data as coordinator.data, which will be available to the sensors to access via self.coordinator.data.
-            return data
-
-        except ConfigEntryAuthFailed:
-            # If we get an authentication error, we mark the coordinator as unavailable and HA will show a repair notification. Also 
-            # don't keep retrying to connect until the user fixes the credentials.
-            self.is_available = False
-            self._was_available = False
-            raise
-        except aiohttp.ClientError as err:
-            # If we get a network error (e.g., connection refused, DNS failure), we mark the coordinator as unavailable but keep 
-            # retrying in case the connection is temporary.
-            self.is_available = False
-            # Log once when connection is lost.
-            if self._was_available is not False:
-                _LOGGER.warning(
-                    "BookStack at %s is unavailable: %s", base_url, err
+        # Cheap visibility into how well the caches are working; %-style args keep formatting lazy, and the guard documents the
+        # convention for any future logging added inside this fan-out.
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Shelf fan-out: %d shelves, %d served from cache, %d books re-counted",
+                len(shelf_summaries), len(unchanged), len(book_refs),
+            )
+
+        # Refresh the per-shelf cache: store the new counts under each shelf's signature and drop shelves that no longer exist.
+        self._shelf_stat_cache = {
+            shelf_summary["id"]: (
+                shelf_signatures[shelf_idx],
+                chapter_counts[shelf_idx],
+                page_counts[shelf_idx],
+            )
+            for shelf_idx, shelf_summary in enumerate(shelf_summaries)
+        }
+
+        return [
+            {
+                "id": shelf_summary["id"],
+                "name": shelf_summary["name"],
+                "book_count": len(shelf_detail.get("books", [])),
+                "chapter_count": chapter_counts[shelf_idx],
+                "page_count": page_counts[shelf_idx],
+            }
+            for shelf_idx, (shelf_summary, shelf_detail) in enumerate(
+                zip(shelf_summaries, shelf_details)
+            )
+        ]
+
+    async def _async_revalidate_shelves(self, get_json) -> None:
+        """Background stale-while-revalidate refresh of the per-shelf data.
+
+        Runs the same fan-out as the inline path, then publishes the result and notifies entity listeners so the shelf sensors update
+        without waiting for the next poll. Failures are logged at debug level and leave the previous (stale) data in place — the next
+        poll will try again, and hard availability problems are surfaced by the main update path, not here.
+        """
+        try:
+            shelves = await self._async_fetch_shelves(get_json)
+            self._shelves_fetched_at = time.monotonic()
+            # Publish by swapping in a fresh snapshot dict rather than mutating the current one in place, so any reader holding a
+            # reference to the old self.data keeps seeing a consistent (if stale) view.
+            if self.data is not None:
+                self.changed_shelf_ids = _changed_shelf_ids(
+                    self.data.get("shelves_by_id", {}), shelves
                 )
-            self._was_available = False
-            # Wrap the original exception in an UpdateFailed to signal to the DataUpdateCoordinator that the update failed due to a 
-            # connection issue. This will trigger the retry logic based on the update interval.
-            raise UpdateFailed(f"Connection error: {err}") from err
+                self.data = {
+                    **self.data,
+                    "shelves": shelves,
+                    "shelves_by_id": {s["id"]: s for s in shelves},
+                }
+            self.async_update_listeners()
+        except (UpdateFailed, ConfigEntryAuthFailed, aiohttp.ClientError, asyncio.TimeoutError) as err:
+            _LOGGER.debug("Background shelf revalidation failed (will retry next poll): %s", err)
 
-        
     async def _async_fetch_latest_github_release(self) -> None:
         """Fetch the latest BookStack release tag and page URL from the GitHub releases API.
 
@@ -257,11 +804,13 @@ class BookStackCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # A descriptive User-Agent is required by the GitHub API terms of service.
         headers = {"User-Agent": "hass-bookstack-integration"}
         try:
-            async with self.session.get(
+            # The shared HA session is used here (not the BookStack-tuned one) since GitHub is a different host and belongs in HA's
+            # general-purpose pool.
+            async with self._shared_session.get(
                 GITHUB_LATEST_RELEASE_URL, headers=headers, timeout=timeout
             ) as resp:
                 if resp.status == 200:
-                    data = await resp.json()
+                    data = json_loads(await resp.read())
                     tag = data.get("tag_name", "")
                     self.latest_version = tag.lstrip("v") if tag else None # GitHub tags are prefixed with "v" (e.g. "v24.10.2"). The BookStack /api/system endpoint returns a bare version string (e.g. "24.10.2"), so we strip the leading "v" for a consistent comparison.
                     self.latest_release_url = data.get("html_url")
@@ -312,25 +861,16 @@ class BookStackCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # normal coordinator polling.
         from homeassistant.exceptions import HomeAssistantError, ServiceValidationError # type: ignore
 
-        headers = {
-            "Authorization": f"Token {self.config['token_id']}:{self.config['token_secret']}", # Define the auth header as normal
-            "Content-Type": "application/json", # We're sending JSON bodies, so tell the API what to expect.
-        }
-        base_url = self.config["url"].rstrip("/") # Get the BookStack base URL from the config and make sure it doesn't end with a slash.
-        timeout = aiohttp.ClientTimeout(total=10) # Set a reasonable timeout for the API requests.
+        headers = self._write_headers # Precomputed auth + Content-Type headers (we're sending JSON bodies).
+        base_url = self._base_url # Precomputed BookStack base URL without a trailing slash.
+        timeout = self._API_TIMEOUT # Shared granular timeout for the API requests.
 
-        # Step 1: Create the book with the provided name, description, and tags. The API requires at least a name, but description and 
-        # tags are optional. 
+        # Build the creation payload with the provided name, description, and tags. The API requires at least a name, but description
+        # and tags are optional.
 
-        # Convert the list of tag dicts into the format the BookStack API expects: 
+        # Convert the list of tag dicts into the format the BookStack API expects:
         #   [{"name": "tag1", "value": "val1"}, {"name": "tag2", "value": ""}, ...].
-        # Stripping whitespace from names avoids accidentally creating blank tags. The "value" key is included even when empty, which is 
-        # valid in the BookStack API and displays the tag as a label-style tag (name only) in the BookStack UI.
-        tag_payload = [
-            {"name": t["name"].strip(), "value": t.get("value", "").strip()}
-            for t in (tags or [])
-            if t.get("name", "").strip()
-        ]
+        tag_payload = _build_tag_payload(tags)
 
         book_payload: dict[str, Any] = {
             "name": name,
@@ -339,76 +879,92 @@ class BookStackCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         }
 
         books_url = f"{base_url}/api/books" # Set the endpoint for creating the book
-        try:
-            async with self.session.post(
-                books_url, headers=headers, json=book_payload, timeout=timeout, ssl=self._ssl
-            ) as resp:
-                if resp.status == 401:
-                    raise HomeAssistantError(
-                        "BookStack rejected the request: invalid API credentials"
-                    )
-                if resp.status == 422:
-                    # Unprocessable Entity — the API rejected the payload (e.g. name is blank). Include the response body for context.
-                    body = await resp.text()
-                    raise ServiceValidationError(
-                        f"BookStack rejected the book data: {body}"
-                    )
-                if resp.status != 200:
-                    # For any other unexpected status code, raise a generic error with the status code. 
-                    raise HomeAssistantError(
-                        f"Unexpected response from BookStack when creating book "
-                        f"(HTTP {resp.status})"
-                    )
-                # For a successful creation, the API returns the full book object in the response body, which includes the new book's 
-                # ID, slug, URL, etc. We return this to the caller so they can use that information in their automation templates if 
-                # needed.
-                book = await resp.json() 
-
-        except (HomeAssistantError, ServiceValidationError):
-            raise  # Re-raise our own errors unchanged
-        except aiohttp.ClientError as err:
-            raise HomeAssistantError(
-                f"Could not connect to BookStack to create book: {err}"
-            ) from err
+        shelf_url = f"{base_url}/api/shelves/{shelf_id}" # Endpoint for fetching and updating the shelf.
 
-        # Step 2: Assign the book to the requested shelf
+        # The book creation (POST /books) and the shelf fetch (GET /shelves/{id}) have no data dependency — the shelf's current book
+        # list is needed only for the final PUT — so the two round-trips are overlapped instead of run back to back, halving the
+        # action's pre-PUT latency. The shelf fetch is a pure read, so firing it even when the creation ends up failing is harmless.
+        # (BookStack has no attach-only endpoint; PUT-ing the shelf with its full book list is the only way to assign a book.)
 
-        # To place a book on a shelf we must PUT the shelf with its complete current book list plus the new book's ID. We fetch the 
-        # shelf first so we don't accidentally remove books that are already on it.
+        async def create_book() -> dict[str, Any]:
+            """POST the new book and return the full book object from the response."""
+            try:
+                async with self.session.post(
+                    books_url, headers=headers, json=book_payload, timeout=timeout, ssl=self._ssl
+                ) as resp:
+                    if resp.status == 401:
+                        raise HomeAssistantError(
+                            "BookStack rejected the request: invalid API credentials"
+                        )
+                    if resp.status == 422:
+                        # Unprocessable Entity — the API rejected the payload (e.g. name is blank). Include the response body for context.
+                        body = (await resp.content.read(8192)).decode(errors="replace") # Cap the error body read so a misbehaving server can't balloon memory with a huge error page.
+                        raise ServiceValidationError(
+                            f"BookStack rejected the book data: {body}"
+                        )
+                    if resp.status != 200:
+                        # For any other unexpected status code, raise a generic error with the status code.
+                        raise HomeAssistantError(
+                            f"Unexpected response from BookStack when creating book "
+                            f"(HTTP {resp.status})"
+                        )
+                    # For a successful creation, the API returns the full book object in the response body, which includes the new book's
+                    # ID, slug, URL, etc. We return this to the caller so they can use that information in their automation templates if
+                    # needed.
+                    return json_loads(await resp.read())
+            except (HomeAssistantError, ServiceValidationError):
+                raise  # Re-raise our own errors unchanged
+            except aiohttp.ClientError as err:
+                raise HomeAssistantError(
+                    f"Could not connect to BookStack to create book: {err}"
+                ) from err
 
-        shelf_url = f"{base_url}/api/shelves/{shelf_id}" # Endpoint for fetching and updating the shelf.
-        try:
-            async with self.session.get(
-                shelf_url, headers=headers, timeout=timeout, ssl=self._ssl
-            ) as resp:
-                if resp.status == 404:
-                    # If the shelf doesn't exist, log the orphaned book ID so the user can find and clean it up.
-                    _LOGGER.warning(
-                        "Book '%s' (id=%s) was created but shelf %s was not found. "
-                        "The book exists in BookStack but is not on any shelf.",
-                        name, book.get("id"), shelf_id,
-                    )
-                    # Return an error back to the user so they also know that the shelf wasn't found.
-                    raise ServiceValidationError(
-                        f"Shelf with ID {shelf_id} was not found. The book was "
-                        f"created (id={book.get('id')}) but could not be assigned "
-                        f"to the shelf."
-                    )
-                if resp.status != 200:
-                    # If we get any other error, raise a generic error with the status code. Again, the book will have been created but 
-                    # not assigned to the shelf.
-                    raise HomeAssistantError(
-                        f"Unexpected response fetching shelf {shelf_id} "
-                        f"(HTTP {resp.status})"
-                    )
-                shelf_data = await resp.json()
+        async def fetch_shelf() -> dict[str, Any] | None:
+            """Fetch the target shelf, returning None on 404 — the caller reports that case with the created book's details."""
+            try:
+                async with self.session.get(
+                    shelf_url, headers=headers, timeout=timeout, ssl=self._ssl
+                ) as resp:
+                    if resp.status == 404:
+                        return None
+                    if resp.status != 200:
+                        # If we get any other error, raise a generic error with the status code. The book may have been created but
+                        # not assigned to the shelf.
+                        raise HomeAssistantError(
+                            f"Unexpected response fetching shelf {shelf_id} "
+                            f"(HTTP {resp.status})"
+                        )
+                    return json_loads(await resp.read())
+            except (HomeAssistantError, ServiceValidationError):
+                raise # Re-raise our own errors unchanged
+            except aiohttp.ClientError as err:
+                raise HomeAssistantError(
+                    f"Could not connect to BookStack to fetch shelf: {err}"
+                ) from err
 
-        except (HomeAssistantError, ServiceValidationError):
-            raise # Re-raise our own errors unchanged
-        except aiohttp.ClientError as err:
-            raise HomeAssistantError(
-                f"Could not connect to BookStack to fetch shelf: {err}"
-            ) from err
+        book_result, shelf_result = await asyncio.gather(
+            create_book(), fetch_shelf(), return_exceptions=True
+        )
+        # A failed creation takes precedence: without a book there is nothing to assign, so any shelf-side error is irrelevant.
+        if isinstance(book_result, BaseException):
+            raise book_result
+        book = book_result
+        if isinstance(shelf_result, BaseException):
+            raise shelf_result
+        if shelf_result is None:
+            # The shelf doesn't exist — log the orphaned book ID so the user can find and clean it up.
+            _LOGGER.warning(
+                "Book '%s' (id=%s) was created but shelf %s was not found. "
+                "The book exists in BookStack but is not on any shelf.",
+                name, book.get("id"), shelf_id,
+            )
+            # Return an error back to the user so they also know that the shelf wasn't found.
+            raise ServiceValidationError(
+                f"Shelf with ID {shelf_id} was not found. The book was "
+                f"created (id={book.get('id')}) but could not be assigned "
+                f"to the shelf."
+            )
+        shelf_data = shelf_result
 
         # Build the updated list of book IDs adding the new book ID to those already on the shelf.
         existing_book_ids = [b["id"] for b in shelf_data.get("books", [])]
@@ -440,8 +996,9 @@ class BookStackCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             "Created book '%s' (id=%s) on shelf %s", name, book.get("id"), shelf_id
         )
 
-        # Trigger an immediate coordinator refresh so the book-count sensors update straight away rather than waiting for the next 
-        # scheduled poll.
+        # Trigger an immediate coordinator refresh so the book-count sensors update straight away rather than waiting for the next
+        # scheduled poll. Forcing the shelf block ensures the per-shelf counts are re-fetched too, not served from the cache.
+        self._force_shelves = True
         await self.async_request_refresh()
 
         # Return the info about the newly created book to the caller (e.g. book ID, slug, url, etc), which can be used in the automation 
@@ -497,20 +1054,13 @@ class BookStackCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 "Either 'html' or 'markdown' must be provided for the page content."
             )
 
-        headers = {
-            "Authorization": f"Token {self.config['token_id']}:{self.config['token_secret']}",
-            "Content-Type": "application/json",
-        }
-        base_url = self.config["url"].rstrip("/")
-        timeout = aiohttp.ClientTimeout(total=10)
+        headers = self._write_headers # Precomputed auth + Content-Type headers.
+        base_url = self._base_url
+        timeout = self._API_TIMEOUT
 
-        # Build the tag payload in the format the BookStack API expects. Tags with an empty value are included as-is. The API treats 
+        # Build the tag payload in the format the BookStack API expects. Tags with an empty value are included as-is. The API treats
         # them as label-style tags.
-        tag_payload = [
-            {"name": t["name"].strip(), "value": t.get("value", "").strip()}
-            for t in (tags or [])
-            if t.get("name", "").strip()
-        ]
+        tag_payload = _build_tag_payload(tags)
 
         # Build the page payload. We always send book_id; chapter_id is only included when provided since sending null/None would be 
         # treated as "no chapter" by the API anyway, but omitting it entirely is cleaner and avoids potential API validation issues.
@@ -543,7 +1093,7 @@ class BookStackCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 if resp.status == 422:
                     # Unprocessable Entity — the API rejected the payload (e.g. blank name, book_id not found). Include the response body 
                     # for context.
-                    body = await resp.text()
+                    body = (await resp.content.read(8192)).decode(errors="replace") # Cap the error body read so a misbehaving server can't balloon memory with a huge error page.
                     raise ServiceValidationError(
                         f"BookStack rejected the page data: {body}"
                     )
@@ -552,7 +1102,7 @@ class BookStackCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                         f"Unexpected response from BookStack when creating page "
                         f"(HTTP {resp.status})"
                     )
-                page = await resp.json()
+                page = json_loads(await resp.read())
 
         except (HomeAssistantError, ServiceValidationError):
             raise
@@ -561,15 +1111,20 @@ class BookStackCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 f"Could not connect to BookStack to create page: {err}"
             ) from err
 
-        _LOGGER.debug(
-            "Created page '%s' (id=%s) in book %s%s",
-            name,
-            page.get("id"),
-            book_id,
-            f", chapter {chapter_id}" if chapter_id is not None else "",
-        )
+        # Guarded with isEnabledFor because the chapter suffix below is built eagerly — without the guard the conditional f-string
+        # would be evaluated on every call even when debug logging is off.
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Created page '%s' (id=%s) in book %s%s",
+                name,
+                page.get("id"),
+                book_id,
+                f", chapter {chapter_id}" if chapter_id is not None else "",
+            )
 
-        # Trigger a coordinator refresh so the page-count sensors update straight away.
+        # Trigger a coordinator refresh so the page-count sensors update straight away. Forcing the shelf block ensures the affected
+        # shelf's page count is re-fetched too, not served from the cache.
+        self._force_shelves = True
         await self.async_request_refresh()
 
         # Return the full page object to the caller so they can use the page ID, slug, URL etc. in automation response templates.
@@ -592,9 +1147,13 @@ class BookStackCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         attempted.
 
         Any tags supplied are *added* to the page. Existing tags on the page are preserved; the combined list (existing + new) is sent in
-        the PUT payload. Duplicate tag name/value pairs are de-duplicated so that calling the action repeatedly does not accumulate 
+        the PUT payload. Duplicate tag name/value pairs are de-duplicated so that calling the action repeatedly does not accumulate
         identical tags.
 
+        Appends to the same page are serialised under a per-page lock so concurrent calls cannot overwrite each other's content, and
+        a burst of appends in quick succession reuses the page object returned by the previous PUT instead of re-fetching it — N
+        rapid appends cost one GET and N PUTs.
+
         Arguments:
             page_id:    The BookStack ID of the page to append content to.
             html:       Content to append as an HTML string. Mutually exclusive with markdown.
@@ -625,122 +1184,130 @@ class BookStackCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 "Either 'html' or 'markdown' must be provided for the content to append."
             )
 
-        headers = {
-            "Authorization": f"Token {self.config['token_id']}:{self.config['token_secret']}",
-            "Content-Type": "application/json",
-        }
-        base_url = self.config["url"].rstrip("/")
-        timeout = aiohttp.ClientTimeout(total=10)
+        headers = self._write_headers # Precomputed auth + Content-Type headers.
+        base_url = self._base_url
+        timeout = self._API_TIMEOUT
         page_url = f"{base_url}/api/pages/{page_id}"
 
-        # Step 1: Fetch the existing page so we can read its current content and tags.
-        try:
-            async with self.session.get(page_url, headers=headers, timeout=timeout, ssl=self._ssl) as resp:
-                if resp.status == 404:
-                    raise ServiceValidationError(
-                        f"Page with ID {page_id} was not found in BookStack."
-                    )
-                if resp.status == 401:
-                    raise HomeAssistantError(
-                        "BookStack rejected the request: invalid API credentials"
-                    )
-                if resp.status != 200:
+        # Appends to the same page are serialised under a per-page lock; see __init__ for why (lost-update race) and for the
+        # burst cache used in Step 1.
+        lock = self._append_locks.setdefault(page_id, asyncio.Lock())
+        async with lock:
+            # Step 1: Get the page's current content and tags — from the burst cache when this append follows one of our own
+            # writes moments ago (see __init__), otherwise with a fresh GET.
+            cached_append = self._append_cache.get(page_id)
+            if cached_append is not None and time.monotonic() - cached_append[0] < self._append_cache_ttl:
+                existing = cached_append[1]
+            else:
+                try:
+                    async with self.session.get(page_url, headers=headers, timeout=timeout, ssl=self._ssl) as resp:
+                        if resp.status == 404:
+                            raise ServiceValidationError(
+                                f"Page with ID {page_id} was not found in BookStack."
+                            )
+                        if resp.status == 401:
+                            raise HomeAssistantError(
+                                "BookStack rejected the request: invalid API credentials"
+                            )
+                        if resp.status != 200:
+                            raise HomeAssistantError(
+                                f"Unexpected response fetching page {page_id} (HTTP {resp.status})"
+                            )
+                        existing = json_loads(await resp.read())
+
+                except (HomeAssistantError, ServiceValidationError):
+                    raise
+                except aiohttp.ClientError as err:
                     raise HomeAssistantError(
-                        f"Unexpected response fetching page {page_id} (HTTP {resp.status})"
-                    )
-                existing = await resp.json()
-
-        except (HomeAssistantError, ServiceValidationError):
-            raise
-        except aiohttp.ClientError as err:
-            raise HomeAssistantError(
-                f"Could not connect to BookStack to fetch page {page_id}: {err}"
-            ) from err
+                        f"Could not connect to BookStack to fetch page {page_id}: {err}"
+                    ) from err
 
-        # Step 2: Determine whether the existing page is Markdown-mode or HTML-mode. The API always returns both fields, but markdown 
-        # will be an empty string for HTML pages.
-        existing_markdown = existing.get("markdown", "")
-        page_is_markdown = bool(existing_markdown)  # non-empty string → Markdown page
+            # Step 2: Determine whether the existing page is Markdown-mode or HTML-mode. The API always returns both fields, but markdown 
+            # will be an empty string for HTML pages.
+            existing_markdown = existing.get("markdown", "")
+            page_is_markdown = bool(existing_markdown)  # non-empty string → Markdown page
 
-        if page_is_markdown and has_html:
-            raise ServiceValidationError(
-                f"Page {page_id} uses Markdown. Provide 'markdown' content to append, not 'html'."
-            )
-        if not page_is_markdown and has_markdown:
-            raise ServiceValidationError(
-                f"Page {page_id} uses HTML. Provide 'html' content to append, not 'markdown'."
-            )
-
-        # Step 3: Build the merged content by appending the new content to the existing content.
-        if page_is_markdown:
-            # For Markdown pages we separate the existing and new content with a blank line, which is the standard Markdown paragraph 
-            # separator and avoids unintentionally merging the last line of the existing content with the first line of the new content.
-            merged_content_key = "markdown"
-            merged_content_value = existing_markdown.rstrip("\n") + "\n\n" + markdown.strip() # type: ignore
-        else:
-            # For HTML pages we simply concatenate the existing and new HTML. BookStack stores page content as a sequence of block-level
-            # elements, so concatenation is safe as long as the supplied html contains valid block-level elements (as the API docs 
-            # recommend).
-            merged_content_key = "html"
-            merged_content_value = existing.get("html", "") + html
-
-        # Step 4: Merge the tags. Preserve all existing tags and add any new ones that are not already present (matched on both name and 
-        # value to avoid exact duplicates).
-        new_tag_payload = [
-            {"name": t["name"].strip(), "value": t.get("value", "").strip()}
-            for t in (tags or [])
-            if t.get("name", "").strip()
-        ]
-        # Start with the existing tags
-        existing_tags = existing.get("tags", [])
-
-        # Normalise existing tags to the same name/value dict structure the API accepts on write, dropping any extra fields (e.g. 
-        # "order") that the read response may include.
-        existing_tag_payload = [
-            {"name": t["name"], "value": t.get("value", "")}
-            for t in existing_tags
-        ]
+            if page_is_markdown and has_html:
+                raise ServiceValidationError(
+                    f"Page {page_id} uses Markdown. Provide 'markdown' content to append, not 'html'."
+                )
+            if not page_is_markdown and has_markdown:
+                raise ServiceValidationError(
+                    f"Page {page_id} uses HTML. Provide 'html' content to append, not 'markdown'."
+                )
 
-        # De-duplicate tags: only add new tags whose (name, value) pair isn't already present.
-        existing_tag_set = {(t["name"], t["value"]) for t in existing_tag_payload}
-        merged_tags = existing_tag_payload + [
-            t for t in new_tag_payload
-            if (t["name"], t["value"]) not in existing_tag_set
-        ]
+            # Step 3: Build the merged content by appending the new content to the existing content.
+            if page_is_markdown:
+                # For Markdown pages we separate the existing and new content with a blank line, which is the standard Markdown paragraph 
+                # separator and avoids unintentionally merging the last line of the existing content with the first line of the new content.
+                merged_content_key = "markdown"
+                merged_content_value = existing_markdown.rstrip("\n") + "\n\n" + markdown.strip() # type: ignore
+            else:
+                # For HTML pages we simply concatenate the existing and new HTML. BookStack stores page content as a sequence of block-level
+                # elements, so concatenation is safe as long as the supplied html contains valid block-level elements (as the API docs 
+                # recommend).
+                merged_content_key = "html"
+                merged_content_value = existing.get("html", "") + html
+
+            # Step 4: Merge the tags. Preserve all existing tags and add any new ones that are not already present (matched on both
+            # name and value to avoid exact duplicates). In the common automation pattern that appends content without tags, no
+            # de-duplication is needed — a single comprehension normalises the existing tags (dropping extra read-only fields like
+            # "order") for the PUT. Only when new tags are supplied do we build the dict keyed on the (name, value) pair, which
+            # handles normalisation, ordering (insertion order: existing tags first, then new ones) and de-duplication in one pass.
+            new_tag_payload = _build_tag_payload(tags)
+            if not new_tag_payload:
+                merged_tags = [
+                    {"name": tag["name"], "value": tag.get("value", "")}
+                    for tag in existing.get("tags", [])
+                ]
+            else:
+                merged: dict[tuple[str, str], dict[str, str]] = {}
+                for tag in existing.get("tags", []):
+                    key = (tag["name"], tag.get("value", ""))
+                    merged.setdefault(key, {"name": key[0], "value": key[1]})
+                for tag in new_tag_payload:
+                    merged.setdefault((tag["name"], tag["value"]), tag)
+                merged_tags = list(merged.values())
+
+            # Step 5: Write the updated page back to BookStack.
+            put_payload: dict[str, Any] = {
+                merged_content_key: merged_content_value,
+                "tags": merged_tags,
+            }
 
-        # Step 5: Write the updated page back to BookStack.
-        put_payload: dict[str, Any] = {
-            merged_content_key: merged_content_value,
-            "tags": merged_tags,
-        }
+            # Handle the outcome of writing the new version of the page back to the API.
+            try:
+                async with self.session.put(
+                    page_url, headers=headers, json=put_payload, timeout=timeout, ssl=self._ssl
+                ) as resp:
+                    if resp.status == 401:
+                        raise HomeAssistantError(
+                            "BookStack rejected the request: invalid API credentials"
+                        )
+                    if resp.status == 422:
+                        body = (await resp.content.read(8192)).decode(errors="replace") # Cap the error body read so a misbehaving server can't balloon memory with a huge error page.
+                        raise ServiceValidationError(
+                            f"BookStack rejected the updated page data: {body}"
+                        )
+                    if resp.status != 200:
+                        raise HomeAssistantError(
+                            f"Unexpected response from BookStack when updating page {page_id} "
+                            f"(HTTP {resp.status})"
+                        )
+                    updated_page = json_loads(await resp.read())
 
-        # Handle the outcome of writing the new version of the page back to the API.
-        try:
-            async with self.session.put(
-                page_url, headers=headers, json=put_payload, timeout=timeout, ssl=self._ssl
-            ) as resp:
-                if resp.status == 401:
-                    raise HomeAssistantError(
-                        "BookStack rejected the request: invalid API credentials"
-                    )
-                if resp.status == 422:
-                    body = await resp.text()
-                    raise ServiceValidationError(
-                        f"BookStack rejected the updated page data: {body}"
-                    )
-                if resp.status != 200:
-                    raise HomeAssistantError(
-                        f"Unexpected response from BookStack when updating page {page_id} "
-                        f"(HTTP {resp.status})"
-                    )
-                updated_page = await resp.json()
+            except (HomeAssistantError, ServiceValidationError):
+                raise # Re-raise our own errors unchanged
+            except aiohttp.ClientError as err:
+                raise HomeAssistantError(
+                    f"Could not connect to BookStack to update page {page_id}: {err}"
+                ) from err
 
-        except (HomeAssistantError, ServiceValidationError):
-            raise # Re-raise our own errors unchanged
-        except aiohttp.ClientError as err:
-            raise HomeAssistantError(
-                f"Could not connect to BookStack to update page {page_id}: {err}"
-            ) from err
+            # Remember the page as we just wrote it so the next append in a burst can skip the re-GET; bound the cache with a cheap
+            # full reset, mirroring the ETag cache.
+            if len(self._append_cache) > 128:
+                self._append_cache.clear()
+            self._append_cache[page_id] = (time.monotonic(), updated_page)
 
         _LOGGER.debug("Appended content to page '%s' (id=%s)", updated_page.get("name"), page_id)
 
@@ -774,15 +1341,13 @@ class BookStackCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """
         from homeassistant.exceptions import HomeAssistantError, ServiceValidationError  # type: ignore
 
-        headers = {
-            "Authorization": f"Token {self.config['token_id']}:{self.config['token_secret']}",
-        }
-        base_url = self.config["url"].rstrip("/")
-        timeout = aiohttp.ClientTimeout(total=10)
+        headers = self._headers # Precomputed auth headers.
+        base_url = self._base_url
+        timeout = self._API_TIMEOUT
 
         async def get_json(endpoint: str) -> dict:
             """Make an authenticated GET request and return the JSON response."""
-            url = f"{base_url}/api/{endpoint.lstrip('/')}"
+            url = self._api_root + endpoint
             try:
                 async with self.session.get(url, headers=headers, timeout=timeout, ssl=self._ssl) as resp:
                     if resp.status == 401:
@@ -791,7 +1356,7 @@ class BookStackCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                         return {}
                     if resp.status != 200:
                         raise HomeAssistantError(f"Unexpected response from BookStack (HTTP {resp.status})")
-                    return await resp.json()
+                    return json_loads(await resp.read())
             except (HomeAssistantError, ServiceValidationError):
                 raise
             except aiohttp.ClientError as err:
@@ -810,12 +1375,9 @@ class BookStackCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # Build a shelf lookup map (book_id -> {shelf_id, shelf_name}) from the shelves the coordinator already has cached. This 
         # avoids additional API calls for the common case and is refreshed on every coordinator poll. We use this to populate 
         # shelf_id/shelf_name on each book result.
+        # Note the cached per-shelf data (data["shelves"]) stores {id, name, book_count, ...} but not the book IDs, so the map is
+        # built from fresh shelf details below.
         book_to_shelf: dict[int, dict] = {}
-        for shelf in self.shelves_data:
-            # shelves_data stores {id, name, book_count, ...} but not the book IDs, so we need a fresh shelf detail call only when 
-            # shelves_data is empty (e.g. per_shelf_enabled is False). In that case we fall back to the shelf detail already fetched 
-            # above (if shelf_id was given) or skip shelf attribution entirely for the all-books case.
-            pass
 
         # Fetch all shelves to build the book->shelf map. We always need this to attribute books to shelves in the response, 
         # regardless of filtering.
@@ -890,15 +1452,13 @@ class BookStackCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """
         from homeassistant.exceptions import HomeAssistantError, ServiceValidationError  # type: ignore
 
-        headers = {
-            "Authorization": f"Token {self.config['token_id']}:{self.config['token_secret']}",
-        }
-        base_url = self.config["url"].rstrip("/")
-        timeout = aiohttp.ClientTimeout(total=10)
+        headers = self._headers # Precomputed auth headers.
+        base_url = self._base_url
+        timeout = self._API_TIMEOUT
 
         async def get_json(endpoint: str) -> dict:
             """Make an authenticated GET request and return the JSON response."""
-            url = f"{base_url}/api/{endpoint.lstrip('/')}"
+            url = self._api_root + endpoint
             try:
                 async with self.session.get(url, headers=headers, timeout=timeout, ssl=self._ssl) as resp:
                     if resp.status == 401:
@@ -907,7 +1467,7 @@ class BookStackCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                         return {}
                     if resp.status != 200:
                         raise HomeAssistantError(f"Unexpected response from BookStack (HTTP {resp.status})")
-                    return await resp.json()
+                    return json_loads(await resp.read())
             except (HomeAssistantError, ServiceValidationError):
                 raise
             except aiohttp.ClientError as err:
@@ -982,15 +1542,13 @@ class BookStackCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """
         from homeassistant.exceptions import HomeAssistantError, ServiceValidationError  # type: ignore
 
-        headers = {
-            "Authorization": f"Token {self.config['token_id']}:{self.config['token_secret']}",
-        }
-        base_url = self.config["url"].rstrip("/")
-        timeout = aiohttp.ClientTimeout(total=10)
+        headers = self._headers # Precomputed auth headers.
+        base_url = self._base_url
+        timeout = self._API_TIMEOUT
 
         async def get_json(endpoint: str) -> dict:
             """Make an authenticated GET request and return the JSON response."""
-            url = f"{base_url}/api/{endpoint.lstrip('/')}"
+            url = self._api_root + endpoint
             try:
                 async with self.session.get(url, headers=headers, timeout=timeout, ssl=self._ssl) as resp:
                     if resp.status == 401:
@@ -999,7 +1557,7 @@ class BookStackCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                         return {}
                     if resp.status != 200:
                         raise HomeAssistantError(f"Unexpected response from BookStack (HTTP {resp.status})")
-                    return await resp.json()
+                    return json_loads(await resp.read())
             except (HomeAssistantError, ServiceValidationError):
                 raise
             except aiohttp.ClientError as err:
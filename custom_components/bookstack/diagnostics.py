@@ -40,6 +40,6 @@ async def async_get_config_entry_diagnostics(
         "entry_data": async_redact_data(dict(entry.data), REDACT_KEYS), # Stored config entry data with sensitive info redacted.
         "entry_options": async_redact_data(dict(entry.options), REDACT_KEYS), # Stored config entry options with sensitive info redacted.
         "scan_interval_seconds": coordinator.update_interval.total_seconds() if coordinator else None, # Current scan interval in seconds.
-        "system": coordinator.system_data if coordinator else {}, # Latest system data fetched from the BookStack API, which includes overall counts of shelves, books, chapters, pages, users, images, and attachments.
-        "shelves": coordinator.shelves_data if coordinator else [], # Latest shelves data fetched from the BookStack API, which includes details of each shelf and its book/chapter/page counts if per-shelf sensors are enabled.
+        "system": (coordinator.data or {}).get("system", {}) if coordinator else {}, # Latest system data fetched from the BookStack API, which includes overall counts of shelves, books, chapters, pages, users, images, and attachments.
+        "shelves": (coordinator.data or {}).get("shelves", []) if coordinator else [], # Latest shelves data fetched from the BookStack API, which includes details of each shelf and its book/chapter/page counts if per-shelf sensors are enabled.
     }
\ No newline at end of file
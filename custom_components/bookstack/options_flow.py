@@ -12,6 +12,14 @@ import voluptuous as vol # type: ignore
 from homeassistant import config_entries # type: ignore
 from .const import CONF_SCAN_INTERVAL, CONF_PER_SHELF_ENABLED, DEFAULT_SCAN_INTERVAL
 
+# The schema structure is fixed — only the pre-filled values differ per entry — so it is compiled once at module load rather than
+# rebuilding the voluptuous validator tree every time the options form is opened. The current values are attached per request with
+# add_suggested_values_to_schema below.
+_OPTIONS_SCHEMA = vol.Schema({
+    vol.Required(CONF_SCAN_INTERVAL): int,
+    vol.Required(CONF_PER_SHELF_ENABLED): bool,
+})
+
 
 class BookStackOptionsFlow(config_entries.OptionsFlow):
     """Options flow for editing scan interval and per-shelf sensors.
@@ -38,11 +46,10 @@ class BookStackOptionsFlow(config_entries.OptionsFlow):
         scan_interval = self.config_entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
         per_shelf_enabled = self.config_entry.options.get(CONF_PER_SHELF_ENABLED, True)
 
-        # Build the form schema using voluptuous. We require both options and set their default values to the current settings, so the 
-        # form is pre-filled.
-        data_schema = vol.Schema({
-            vol.Required(CONF_SCAN_INTERVAL, default=scan_interval): int,
-            vol.Required(CONF_PER_SHELF_ENABLED, default=per_shelf_enabled): bool,
-        })
+        # Attach the current values to the precompiled schema so the form is pre-filled without rebuilding the validator tree.
+        data_schema = self.add_suggested_values_to_schema(
+            _OPTIONS_SCHEMA,
+            {CONF_SCAN_INTERVAL: scan_interval, CONF_PER_SHELF_ENABLED: per_shelf_enabled},
+        )
 
         return self.async_show_form(step_id="init", data_schema=data_schema)
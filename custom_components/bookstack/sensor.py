@@ -14,21 +14,21 @@ async_setup_entry also:
 """
 from __future__ import annotations
 
-from datetime import datetime
+import logging
 from typing import Any
 
 from homeassistant.components.sensor import SensorEntity, SensorStateClass, SensorDeviceClass # type: ignore
 from homeassistant.config_entries import ConfigEntry # type: ignore
 from homeassistant.core import HomeAssistant, callback # type: ignore
 from homeassistant.helpers import entity_registry # type: ignore
+from homeassistant.helpers.debounce import Debouncer # type: ignore
 from homeassistant.helpers.entity_platform import AddEntitiesCallback # type: ignore
 from homeassistant.helpers.update_coordinator import CoordinatorEntity # type: ignore
-from homeassistant.helpers.device_registry import DeviceInfo # type: ignore
-from homeassistant.util import dt as dt_util # type: ignore
 
-from .const import DOMAIN
 from .coordinator import BookStackCoordinator
 
+_LOGGER = logging.getLogger(__name__)
+
 # Only allow a single sensor update at a time to avoid HA warnings about overlapping updates. This is important because the coordinator 
 # updates all sensors when it fetches new data, and we don't want multiple sensors trying to update simultaneously if the coordinator fetches 
 # data more frequently than the sensor update time.
@@ -48,13 +48,18 @@ STATIC_SENSORS: dict[str, tuple[str, str]] = {
     "attachments": ("attachments", "mdi:paperclip"),
 }
 
-# (data_key, translation_key, unique_id_suffix, icon) translation_key links to "entity.sensor.shelf_<key>.name" in strings.json, which uses 
-# a {shelf_name} placeholder supplied at runtime.
-SHELF_SENSOR_TYPES: list[tuple[str, str, str, str]] = [
+# (data_key, translation_key, unique_id_suffix, icon) translation_key links to "entity.sensor.shelf_<key>.name" in strings.json, which uses
+# a {shelf_name} placeholder supplied at runtime. A tuple rather than a list: it is re-iterated once per shelf at setup and per new
+# shelf afterwards, and a tuple is immutable shared state that is also marginally faster to iterate.
+SHELF_SENSOR_TYPES: tuple[tuple[str, str, str, str], ...] = (
     ("book_count",    "shelf_books",    "books",    "mdi:book-multiple"),
     ("chapter_count", "shelf_chapters", "chapters", "mdi:book-open"),
     ("page_count",    "shelf_pages",    "pages",    "mdi:file-document-multiple"),
-]
+)
+
+# Shared fallback for shelf lookups that miss (e.g. the shelf was just deleted). A module-level singleton avoids allocating a fresh
+# empty dict on every state write; callers only read from it.
+_EMPTY_SHELF: dict[str, Any] = {}
 
 
 async def async_setup_entry(
@@ -71,15 +76,19 @@ async def async_setup_entry(
         for key, (translation_key, icon) in STATIC_SENSORS.items()
     ]
 
+    # All coordinator state lives in the single snapshot dict coordinator.data; the per-shelf list sits under the "shelves" key.
+    shelves = (coordinator.data or {}).get("shelves", [])
+
     # --- Per-shelf sensors (optional) ---
     if coordinator.per_shelf_enabled:
-        for shelf in coordinator.shelves_data:
-            for data_key, tk_suffix, id_suffix, icon in SHELF_SENSOR_TYPES:
-                entities.append(
-                    BookStackShelfSensor(
-                        coordinator, entry, shelf, data_key, tk_suffix, id_suffix, icon
-                    )
-                )
+        # One extend with a generator instead of 3 appends per shelf; the list grows in bulk rather than one resize at a time.
+        entities.extend(
+            BookStackShelfSensor(
+                coordinator, entry, shelf, data_key, tk_suffix, id_suffix, icon
+            )
+            for shelf in shelves
+            for data_key, tk_suffix, id_suffix, icon in SHELF_SENSOR_TYPES
+        )
 
     # --- Last-updated-page sensor ---
     entities.append(BookStackLastUpdatedPageSensor(coordinator, entry))
@@ -92,7 +101,9 @@ async def async_setup_entry(
     # BookStack, keeping the registry clean after shelf deletions.
     if coordinator.per_shelf_enabled:
         registry = entity_registry.async_get(hass)
-        live_shelf_ids = {s["id"] for s in coordinator.shelves_data}
+        # The coordinator's shelves_by_id index already holds every live shelf ID; its keys view supports membership tests and set
+        # arithmetic directly, so no ID set has to be rebuilt from the shelf list here or in the listener below.
+        live_shelf_ids = (coordinator.data or {}).get("shelves_by_id", {}).keys()
         for entity_entry in entity_registry.async_entries_for_config_entry(registry, entry.entry_id):
             uid = entity_entry.unique_id
             # Shelf UIDs follow the pattern: "<entry_id>_shelf_<shelf_id>_<suffix>"
@@ -104,54 +115,71 @@ async def async_setup_entry(
                 except (ValueError, IndexError):
                     pass
 
-    # Track which shelf IDs we have already created sensors for, so that when the coordinator updates with new shelves, we can check if 
+    # Track which shelf IDs we have already created sensors for, so that when the coordinator updates with new shelves, we can check if
     # there are new shelves to create sensors for. We use a set of shelf IDs for easy lookup.
-    known_shelf_ids: set[int] = {s["id"] for s in coordinator.shelves_data}
+    known_shelf_ids: set[int] = set((coordinator.data or {}).get("shelves_by_id", {}))
+    # The coordinator reuses the previous shelves list by reference whenever the per-shelf cache is served unchanged, so an identity
+    # check on the list spots "nothing changed" without rebuilding the ID set — which is the outcome of almost every refresh.
+    last_shelves: list[dict[str, Any]] = shelves
+
+    # New shelves are not registered the instant they are detected; they are accumulated here and flushed in one batch once the
+    # debouncer's cooldown passes. A bulk import in BookStack can surface new shelves across several rapid refreshes (write actions
+    # trigger an immediate refresh), and without the debounce each refresh would run the full entity-registration pipeline for its
+    # own small batch.
+    pending_shelf_ids: set[int] = set()
+
+    async def _flush_new_shelves() -> None:
+        """Create sensors for every shelf accumulated in pending_shelf_ids with a single async_add_entities call."""
+        shelves_by_id = (coordinator.data or {}).get("shelves_by_id", {})
+        new_entities: list[SensorEntity] = [
+            BookStackShelfSensor(
+                coordinator, entry, shelves_by_id[shelf_id], data_key, tk_suffix, id_suffix, icon
+            )
+            # Guard against a shelf being deleted again during the cooldown window — it simply drops out of the batch.
+            for shelf_id in pending_shelf_ids
+            if shelf_id in shelves_by_id
+            for data_key, tk_suffix, id_suffix, icon in SHELF_SENSOR_TYPES
+        ]
+        pending_shelf_ids.clear()
+        if new_entities:
+            async_add_entities(new_entities)
+
+    add_debouncer = Debouncer(
+        hass, _LOGGER, cooldown=2.0, immediate=False, function=_flush_new_shelves
+    )
+    entry.async_on_unload(add_debouncer.async_shutdown)
 
     @callback
     def _handle_coordinator_update() -> None:
-        """Check for new shelves and add sensors for them if needed when the coordinator updates with new data.
-        
-        The @callback decorator tells HA that this function is a callback that should be run in the event loop (i.e. synchronously). This 
-        is important because the coordinator calls its listeners synchronously after fetching new data, so this function needs to be able 
+        """Check for new shelves and queue sensors for them when the coordinator updates with new data.
+
+        The @callback decorator tells HA that this function is a callback that should be run in the event loop (i.e. synchronously). This
+        is important because the coordinator calls its listeners synchronously after fetching new data, so this function needs to be able
         to run synchronously without blocking the event loop.
 
-        We compare the current shelf IDs from the coordinator's shelves_data with the known_shelf_ids set. If there are any new IDs, we 
-        create new sensors for them and add them to HA. After adding new sensors, we update the known_shelf_ids set to include the new IDs.
+        We compare the current shelf IDs from coordinator.data["shelves"] with the known_shelf_ids set. Any new IDs are added to the
+        pending set and the debounced flush is scheduled; known_shelf_ids is updated immediately so the same shelf is never queued twice.
+        A same-object shelves list means the coordinator served its cache unchanged, so the ID diff is skipped entirely.
         """
-        nonlocal known_shelf_ids
-        current_ids = {s["id"] for s in coordinator.shelves_data}
+        nonlocal known_shelf_ids, last_shelves
+        data = coordinator.data or {}
+        current_shelves = data.get("shelves", [])
+        if current_shelves is last_shelves:
+            return
+        last_shelves = current_shelves
+        # The keys view of the coordinator's shelves_by_id index supports set difference directly, so no per-refresh ID set is built.
+        current_ids = data.get("shelves_by_id", {}).keys()
         new_ids = current_ids - known_shelf_ids
         if new_ids and coordinator.per_shelf_enabled:
-            new_entities: list[SensorEntity] = [
-                BookStackShelfSensor(
-                    coordinator, entry, shelf, data_key, tk_suffix, id_suffix, icon
-                )
-                for shelf in coordinator.shelves_data
-                if shelf["id"] in new_ids
-                for data_key, tk_suffix, id_suffix, icon in SHELF_SENSOR_TYPES
-            ]
-            async_add_entities(new_entities)
-            # Update the known_shelf_ids set to include the new IDs, so we don't create duplicate sensors on the next update.
-            known_shelf_ids = current_ids
+            pending_shelf_ids.update(new_ids)
+            known_shelf_ids = set(current_ids)
+            add_debouncer.async_schedule_call()
 
-    # Register the listener on the coordinator so that _handle_coordinator_update is called whenever the coordinator fetches new data. 
+    # Register the listener on the coordinator so that _handle_coordinator_update is called whenever the coordinator fetches new data.
     # This allows us to dynamically add sensors for new shelves.
     coordinator.async_add_listener(_handle_coordinator_update)
 
 
-def _device_info(coordinator: BookStackCoordinator, entry: ConfigEntry) -> DeviceInfo:
-    """Return shared DeviceInfo for all BookStack entities."""
-    return DeviceInfo(
-        identifiers={(DOMAIN, entry.entry_id)},
-        name=f"BookStack ({entry.data['url']})",
-        manufacturer="BookStack",
-        model="BookStack",
-        sw_version=coordinator.version,
-        configuration_url=entry.data["url"],
-    )
-
-
 class BookStackSensor(CoordinatorEntity[BookStackCoordinator], SensorEntity):
     """Numeric sensor for one of the BookStack-wide aggregate counts.
 
@@ -175,18 +203,22 @@ class BookStackSensor(CoordinatorEntity[BookStackCoordinator], SensorEntity):
         self._attr_translation_key = translation_key  # resolved via strings.json entity section
         self._attr_icon = icon
         self._attr_unique_id = f"{entry.entry_id}_{key}"
-        self._attr_device_info = _device_info(coordinator, entry)
+        self._attr_device_info = coordinator.device_info(entry) # Shared cached DeviceInfo — one dict for every entity on this entry.
+        self._update_attrs() # Seed the state from the coordinator's first refresh so the entity is correct when first added.
 
-    @property
-    def native_value(self) -> int | None:
-        """Return the current count, cast to int to guard against float API responses."""
-        val = self.coordinator.data.get(self._key) if self.coordinator.data else None
-        return int(val) if val is not None else None
+    @callback
+    def _update_attrs(self) -> None:
+        """Recompute the cached state from coordinator data. Runs once per refresh, not once per HA state read."""
+        data = self.coordinator.data
+        val = data["counts"].get(self._key) if data else None
+        # Cast to int to guard against float API responses.
+        self._attr_native_value = int(val) if val is not None else None
 
-    @property
-    def available(self) -> bool:
-        """Return False when BookStack was unreachable on the last poll."""
-        return self.coordinator.is_available and super().available
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the cached state, then let CoordinatorEntity write it to HA."""
+        self._update_attrs()
+        super()._handle_coordinator_update()
 
 
 class BookStackShelfSensor(CoordinatorEntity[BookStackCoordinator], SensorEntity):
@@ -220,29 +252,43 @@ class BookStackShelfSensor(CoordinatorEntity[BookStackCoordinator], SensorEntity
         self._attr_icon = icon
         # Shelf ID in the unique_id keeps it stable even after a shelf rename.
         self._attr_unique_id = f"{entry.entry_id}_shelf_{shelf['id']}_{id_suffix}"
-        self._attr_device_info = _device_info(coordinator, entry)
+        self._attr_device_info = coordinator.device_info(entry) # Shared cached DeviceInfo — one dict for every entity on this entry.
+        # The shelf ID attribute never changes, so it is set once rather than rebuilt by a property on every state read.
+        self._attr_extra_state_attributes = {"shelf_id": self._shelf_id}
+        # Mirrors the coordinator's health at the last state write, so the skip logic below never swallows an availability transition.
+        self._was_available: bool = coordinator.last_update_success
+        self._update_attrs() # Seed the state from the coordinator's first refresh so the entity is correct when first added.
 
     def _current_shelf(self) -> dict[str, Any]:
-        """Locate this shelf's current data in coordinator.shelves_data."""
-        for shelf in self.coordinator.shelves_data:
-            if shelf["id"] == self._shelf_id:
-                return shelf
-        return {}
-
-    @property
-    def native_value(self) -> int:
-        """Return the shelf metric value, cast to int."""
-        return int(self._current_shelf().get(self._data_key, 0))
-
-    @property
-    def available(self) -> bool:
-        """Return False when BookStack was unreachable on the last poll."""
-        return self.coordinator.is_available and super().available
-    
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the BookStack shelf ID as an entity attribute."""
-        return {"shelf_id": self._shelf_id}
+        """Locate this shelf's current data via the coordinator's by-ID index."""
+        # The coordinator publishes shelves_by_id alongside the shelf list, so this is a single dict lookup rather than a scan of
+        # every shelf — with three sensors per shelf a scan would make each refresh quadratic in shelf count.
+        shelves_by_id = (self.coordinator.data or {}).get("shelves_by_id", _EMPTY_SHELF)
+        return shelves_by_id.get(self._shelf_id, _EMPTY_SHELF)
+
+    @callback
+    def _update_attrs(self) -> None:
+        """Recompute the cached state from coordinator data. Runs once per refresh, not once per HA state read."""
+        self._attr_native_value = int(self._current_shelf().get(self._data_key, 0))
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the cached state, then let CoordinatorEntity write it to HA.
+
+        The coordinator records which shelves actually changed each refresh; if this shelf is untouched there is nothing new to
+        write, so the whole state write is skipped. The skip only applies while the coordinator is healthy and was healthy at the
+        previous write — availability transitions (in either direction) must always be written.
+        """
+        healthy = self.coordinator.last_update_success
+        if (
+            healthy
+            and self._was_available
+            and self._shelf_id not in self.coordinator.changed_shelf_ids
+        ):
+            return
+        self._was_available = healthy
+        self._update_attrs()
+        super()._handle_coordinator_update()
 
 
 class BookStackLastUpdatedPageSensor(CoordinatorEntity[BookStackCoordinator], SensorEntity):
@@ -269,34 +315,28 @@ class BookStackLastUpdatedPageSensor(CoordinatorEntity[BookStackCoordinator], Se
         """Initialise the last-updated-page sensor."""
         super().__init__(coordinator)
         self._attr_unique_id = f"{entry.entry_id}_last_updated_page"
-        self._attr_device_info = _device_info(coordinator, entry)
-
-    @property
-    def available(self) -> bool:
-        """Return False when BookStack was unreachable on the last poll."""
-        return self.coordinator.is_available and super().available
-
-    @property
-    def native_value(self) -> datetime | None:
-        """Return the most-recently-updated page timestamp in the HA local timezone."""
-        updated_at = self.coordinator.last_updated_page.get("updated_at")
-        if not updated_at:
-            return None
-        try:
-            # fromisoformat does not accept 'Z' before Python 3.11; normalise first.
-            utc_dt = datetime.fromisoformat(updated_at.replace("Z", "+00:00"))
-            return dt_util.as_local(utc_dt)
-        except (ValueError, AttributeError):
-            return None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return supplemental page metadata as entity attributes."""
-        page = self.coordinator.last_updated_page
-        return {
+        self._attr_device_info = coordinator.device_info(entry) # Shared cached DeviceInfo — one dict for every entity on this entry.
+        self._update_attrs() # Seed the state from the coordinator's first refresh so the entity is correct when first added.
+
+    @callback
+    def _update_attrs(self) -> None:
+        """Recompute the cached state and attributes from coordinator data.
+
+        The coordinator pre-parses updated_at into a localised datetime when it fetches the page detail (updated_dt), so this is a
+        pure dict read — no ISO-8601 parsing happens on the entity side at all.
+        """
+        page = (self.coordinator.data or {}).get("last_updated_page", {})
+        self._attr_native_value = page.get("updated_dt")
+        self._attr_extra_state_attributes = {
             "page_name":     page.get("name"),
             "page_id":       page.get("id"),
             "updated_by":    page.get("updated_by_name"),
             "updated_by_id": page.get("updated_by_id"),
             "page_url":      page.get("url"),
-        }
\ No newline at end of file
+        }
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the cached state, then let CoordinatorEntity write it to HA."""
+        self._update_attrs()
+        super()._handle_coordinator_update()
\ No newline at end of file
@@ -0,0 +1,295 @@
+"""Action (service) registration and handling for the BookStack integration.
+
+This module holds everything action-related: the Voluptuous schemas that validate call data, the dispatch table mapping action names to
+coordinator methods, the short-TTL response cache for the read-only list actions, and the generic handler. It lives in its own module
+(rather than __init__.py) so that importing the integration package stays cheap — Voluptuous and the schema construction below are only
+imported and executed when async_setup actually registers the actions, not when HA first imports the package during startup.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any
+
+import voluptuous as vol # type: ignore
+
+from homeassistant.core import HomeAssistant, ServiceCall, SupportsResponse # type: ignore
+from homeassistant.exceptions import ServiceValidationError # type: ignore
+from homeassistant.helpers import config_validation # type: ignore
+
+from .const import (
+    DOMAIN,
+    ACTION_CREATE_BOOK,
+    ACTION_CREATE_PAGE,
+    ACTION_APPEND_PAGE,
+    ACTION_LIST_BOOKS,
+    ACTION_LIST_CHAPTERS,
+    ACTION_LIST_PAGES,
+)
+from .coordinator import BookStackCoordinator
+
+# Shared validators reused across the action schemas below. Voluptuous compiles validators when the Schema is constructed, so building
+# these once at module import and referencing them in each action schema avoids compiling the identical tag sub-schema (and the
+# positive-integer check) once per action schema. All BookStack IDs start at 1, so _POSITIVE_INT is the validator for every *_id field.
+_POSITIVE_INT = vol.All(int, vol.Range(min=1))
+
+# Tag dicts are accepted by create_book, create_page, and append_page and always have the same shape: a required "name" and an optional
+# "value" (empty value displays the tag as a label-style tag in the BookStack UI).
+_TAG_SCHEMA = vol.Schema(
+    {
+        vol.Required("name"): config_validation.string,
+        vol.Optional("value", default=""): config_validation.string,
+    }
+)
+
+# Voluptuous schema that validates the data payload when the create_book action is called (from the UI, an automation, or a script).
+# HA validates this before  our handler runs, so we can trust the types and required fields are present.
+# Field notes:
+#   shelf_id    —
+#   name        — non-empty string; config_validation.string also strips leading/trailing whitespace
+#   description — optional, defaults to an empty string
+#   tags        — optional list of tag dicts with required "name" and optional "value"; defaults to an empty list (the callable
+#                 list default has Voluptuous call list() per validation instead of copying a shared literal)
+CREATE_BOOK_SCHEMA = vol.Schema(
+    {
+        vol.Optional("config_entry_id"): config_validation.string, # targets a specific BookStack entry when more than one is configured
+        vol.Required("shelf_id"): _POSITIVE_INT, # must be a positive integer (BookStack IDs start at 1)
+        vol.Required("name"): config_validation.string, # non-empty string; config_validation.string also strips leading/trailing whitespace
+        vol.Optional("description", default=""): config_validation.string, # optional, defaults to an empty string
+        vol.Optional("tags", default=list): [_TAG_SCHEMA],
+    },
+    extra=vol.PREVENT_EXTRA,
+)
+
+# Voluptuous schema that validates the data payload when the create_page action is called. Both html and markdown are optional at the schema
+# level — the coordinator enforces that exactly one must be supplied, since Voluptuous cannot handle mutual exclusivity.
+# Field notes:
+#   book_id    — required; the book the page will be created in
+#   chapter_id — optional; if supplied the page is nested inside that chapter
+#   name       — non-empty string; the page title
+#   html       — page content as HTML; mutually exclusive with markdown
+#   markdown   — page content as Markdown; mutually exclusive with html
+#   tags       — optional list of tag dicts with required "name" and optional "value"
+CREATE_PAGE_SCHEMA = vol.Schema(
+    {
+        vol.Optional("config_entry_id"): config_validation.string,
+        vol.Required("book_id"): _POSITIVE_INT,
+        vol.Optional("chapter_id"): _POSITIVE_INT,
+        vol.Required("name"): config_validation.string,
+        vol.Optional("html"): config_validation.string,
+        vol.Optional("markdown"): config_validation.string,
+        vol.Optional("tags", default=list): [_TAG_SCHEMA],
+    },
+    extra=vol.PREVENT_EXTRA,
+)
+
+# Voluptuous schema that validates the data payload when the append_page action is called. As with create_page, html and markdown are
+# both optional at the schema level. The coordinator enforces that exactly one must be supplied and that it matches the existing page's
+# content type.
+# Field notes:
+#   page_id  — required; the ID of the page to append content to
+#   html     — content to append as HTML; mutually exclusive with markdown
+#   markdown — content to append as Markdown; mutually exclusive with html
+#   tags     — optional list of tag dicts to add to the page; existing tags are preserved
+APPEND_PAGE_SCHEMA = vol.Schema(
+    {
+        vol.Optional("config_entry_id"): config_validation.string,
+        vol.Required("page_id"): _POSITIVE_INT,
+        vol.Optional("html"): config_validation.string,
+        vol.Optional("markdown"): config_validation.string,
+        vol.Optional("tags", default=list): [_TAG_SCHEMA],
+    },
+    extra=vol.PREVENT_EXTRA,
+)
+
+# Voluptuous schema for the list_books action. shelf_id is entirely optional; when omitted all books are returned, when provided only
+# books on that shelf are returned.
+# Field notes:
+#   shelf_id  — required; the ID of the shelf to list books from
+LIST_BOOKS_SCHEMA = vol.Schema(
+    {
+        vol.Optional("config_entry_id"): config_validation.string,
+        vol.Optional("shelf_id"): _POSITIVE_INT,
+    },
+    extra=vol.PREVENT_EXTRA,
+)
+
+# Voluptuous schema for the list_chapters action. book_id is required as chapters are always scoped to a specific book.
+# Field notes:
+#   book_id  — required; the ID of the book to list chapters from
+LIST_CHAPTERS_SCHEMA = vol.Schema(
+    {
+        vol.Optional("config_entry_id"): config_validation.string,
+        vol.Required("book_id"): _POSITIVE_INT,
+    },
+    extra=vol.PREVENT_EXTRA,
+)
+
+# Voluptuous schema for the list_pages action. book_id is required; chapter_id is optional and, when supplied, narrows results to pages
+# within that chapter. If the chapter does not belong to the book a ServiceValidationError is raised by the coordinator.
+# Field notes:
+#   book_id  — required; the ID of the book to list pages from
+#   chapter_id — optional; the ID of the chapter to list pages from. Must belong to the book specified by book_id
+LIST_PAGES_SCHEMA = vol.Schema(
+    {
+        vol.Optional("config_entry_id"): config_validation.string,
+        vol.Required("book_id"): _POSITIVE_INT,
+        vol.Optional("chapter_id"): _POSITIVE_INT,
+    },
+    extra=vol.PREVENT_EXTRA,
+)
+
+# Tiny TTL-bounded LRU cache for the read-only list_* actions. Automations and dashboards sometimes fire the same list action several
+# times in quick succession (e.g. a script that populates multiple template fields); each invocation costs a full paginated API walk.
+# Responses are cached for a short window keyed by the action name plus the exact call data, so identical re-invocations within the TTL
+# return the previous response without touching the API. The write actions (create_book, create_page, append_page) are deliberately NOT
+# cached — repeating a write action must always perform the write.
+_LIST_CACHE: OrderedDict[tuple, tuple[float, dict]] = OrderedDict()
+_LIST_CACHE_MAX = 10 # Bound the cache so it can never grow beyond a handful of recent responses.
+_LIST_CACHE_TTL = 1.0 # Seconds an entry stays valid; just long enough to collapse a burst of identical calls.
+
+
+def _cached_list_response(action: str, call: ServiceCall) -> tuple[tuple, dict | None]:
+    """Return the cache key for this call and the cached response if one is still fresh."""
+    key = (action, tuple(sorted(call.data.items())))
+    entry = _LIST_CACHE.get(key)
+    if entry is not None and time.monotonic() - entry[0] < _LIST_CACHE_TTL:
+        _LIST_CACHE.move_to_end(key) # Refresh LRU position on a hit.
+        return key, entry[1]
+    return key, None
+
+
+def _store_list_response(key: tuple, response: dict) -> None:
+    """Store a list action response in the cache, evicting the oldest entry when full."""
+    _LIST_CACHE[key] = (time.monotonic(), response)
+    _LIST_CACHE.move_to_end(key)
+    while len(_LIST_CACHE) > _LIST_CACHE_MAX:
+        _LIST_CACHE.popitem(last=False)
+
+
+def _get_coordinator(call: ServiceCall) -> BookStackCoordinator:
+    """Resolve and return the coordinator for the targeted config entry.
+
+    Coordinators are looked up in the pre-resolved map that async_setup_entry maintains in hass.data, which is a single dict access
+    rather than walking the config-entries registry and dereferencing entry.runtime_data on every action call.
+    """
+    coordinators: dict[str, BookStackCoordinator] = call.hass.data.get(DOMAIN, {}).get("coordinators", {})
+    target_id: str | None = call.data.get("config_entry_id")
+    if target_id:
+        coordinator = coordinators.get(target_id)
+    else:
+        # No explicit target: fall back to the first (usually only) loaded entry, matching the setup order.
+        coordinator = next(iter(coordinators.values()), None)
+
+    if coordinator is None:
+        raise ServiceValidationError(
+            "No BookStack config entry found"
+            + (f" with ID '{target_id}'" if target_id else "")
+        )
+
+    if not coordinator.last_update_success:
+        raise ServiceValidationError(
+            "BookStack is currently unavailable. Check the Connectivity sensor and your BookStack server before retrying."
+        )
+    return coordinator
+
+
+# Shared immutable default for the tags argument. The coordinator methods only iterate the supplied tags, so handing out the same
+# empty tuple avoids allocating a fresh empty list on every action call that omits tags.
+_EMPTY_TAGS: tuple[dict, ...] = ()
+
+# Sentinel used in the dispatch table below to mark keys that are always present in the validated call data (vol.Required, or
+# vol.Optional with a schema-supplied default), so the generic handler reads them with a plain subscript instead of .get.
+_MISSING = object()
+
+# Dispatch table driving both action registration and call handling. Each entry maps an action name to:
+#   method           — the coordinator method that implements the action
+#   spec             — kwarg name -> default; _MISSING means the key is guaranteed present in the validated call data
+#   schema           — the Voluptuous schema HA validates the call data against before our handler runs
+#   supports_response — OPTIONAL for the write actions (data returned on request), ONLY for the read-only list actions
+# The single generic handler below walks the spec instead of six near-identical handlers each repeating the same call.data.get chains.
+_ACTIONS: dict[str, tuple[str, dict[str, Any], vol.Schema, SupportsResponse]] = {
+    ACTION_CREATE_BOOK: (
+        "async_create_book",
+        {"shelf_id": _MISSING, "name": _MISSING, "description": "", "tags": _EMPTY_TAGS},
+        CREATE_BOOK_SCHEMA,
+        SupportsResponse.OPTIONAL,
+    ),
+    ACTION_CREATE_PAGE: (
+        "async_create_page",
+        {"book_id": _MISSING, "name": _MISSING, "chapter_id": None, "html": None, "markdown": None, "tags": _EMPTY_TAGS},
+        CREATE_PAGE_SCHEMA,
+        SupportsResponse.OPTIONAL,
+    ),
+    ACTION_APPEND_PAGE: (
+        "async_append_page",
+        {"page_id": _MISSING, "html": None, "markdown": None, "tags": _EMPTY_TAGS},
+        APPEND_PAGE_SCHEMA,
+        SupportsResponse.OPTIONAL,
+    ),
+    ACTION_LIST_BOOKS: (
+        "async_list_books",
+        {"shelf_id": None},
+        LIST_BOOKS_SCHEMA,
+        SupportsResponse.ONLY,
+    ),
+    ACTION_LIST_CHAPTERS: (
+        "async_list_chapters",
+        {"book_id": _MISSING},
+        LIST_CHAPTERS_SCHEMA,
+        SupportsResponse.ONLY,
+    ),
+    ACTION_LIST_PAGES: (
+        "async_list_pages",
+        {"book_id": _MISSING, "chapter_id": None},
+        LIST_PAGES_SCHEMA,
+        SupportsResponse.ONLY,
+    ),
+}
+
+
+async def _handle_action(call: ServiceCall) -> dict:
+    """Handle any bookstack.* action via the dispatch table.
+
+    Looks up the coordinator method and argument spec for the called action, builds the kwargs from the validated call data, and
+    invokes the method. The read-only list actions (SupportsResponse.ONLY) additionally go through the short-TTL response cache.
+    """
+    method_name, spec, _schema, supports_response = _ACTIONS[call.service]
+
+    # Only the list actions are safe to cache: they are pure reads, and they are exactly the actions registered with
+    # SupportsResponse.ONLY. The write actions must always reach the API.
+    cacheable = supports_response is SupportsResponse.ONLY
+    if cacheable:
+        key, cached = _cached_list_response(call.service, call)
+        if cached is not None:
+            return cached
+
+    coordinator = _get_coordinator(call)
+    data = call.data
+    kwargs = {
+        kwarg: (data[kwarg] if default is _MISSING else data.get(kwarg, default))
+        for kwarg, default in spec.items()
+    }
+    result = await getattr(coordinator, method_name)(**kwargs)
+
+    if cacheable:
+        _store_list_response(key, result)
+    return result
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register all BookStack actions with Home Assistant.
+
+    Called once from async_setup in __init__.py. Registration is a single pass over the dispatch table; every action shares the
+    generic _handle_action handler, with the table supplying the per-action schema for validating input data and the supports_response
+    flag (the write actions return data optionally while the list_* actions exist solely to return data).
+    """
+    for action, (_method, _spec, schema, supports_response) in _ACTIONS.items():
+        hass.services.async_register(
+            domain=DOMAIN,
+            service=action,
+            service_func=_handle_action,
+            schema=schema,
+            supports_response=supports_response,
+        )
@@ -24,9 +24,7 @@ from homeassistant.core import HomeAssistant  # type: ignore
 from homeassistant.helpers.entity import EntityCategory  # type: ignore
 from homeassistant.helpers.entity_platform import AddEntitiesCallback  # type: ignore
 from homeassistant.helpers.update_coordinator import CoordinatorEntity  # type: ignore
-from homeassistant.helpers.device_registry import DeviceInfo  # type: ignore
 
-from .const import DOMAIN
 from .coordinator import BookStackCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -44,22 +42,10 @@ async def async_setup_entry(
     async_add_entities([BookStackUpdateEntity(coordinator, entry)])
 
 
-def _device_info(coordinator: BookStackCoordinator, entry: ConfigEntry) -> DeviceInfo:
-    """Return shared DeviceInfo so this entity appears on the same device card."""
-    return DeviceInfo(
-        identifiers={(DOMAIN, entry.entry_id)},
-        name=f"BookStack ({entry.data['url']})",
-        manufacturer="BookStack",
-        model="BookStack",
-        sw_version=coordinator.version,
-        configuration_url=entry.data["url"],
-    )
-
-
 class BookStackUpdateEntity(CoordinatorEntity[BookStackCoordinator], UpdateEntity):
     """Update entity that tracks available BookStack releases on GitHub.
 
-    Installed version : coordinator.version (from /api/system).
+    Installed version : coordinator.data["version"] (from /api/system).
     Latest version    : coordinator.latest_version (from GitHub releases API).
     Release URL       : coordinator.latest_release_url (GitHub release page).
 
@@ -85,12 +71,12 @@ class BookStackUpdateEntity(CoordinatorEntity[BookStackCoordinator], UpdateEntit
         super().__init__(coordinator)
         self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_update"
-        self._attr_device_info = _device_info(coordinator, entry)
+        self._attr_device_info = coordinator.device_info(entry) # Shared cached DeviceInfo so this entity joins the same device card.
 
     @property
     def installed_version(self) -> str | None:
         """Return the version currently running on the BookStack server."""
-        return self.coordinator.version
+        return (self.coordinator.data or {}).get("version")
 
     @property
     def latest_version(self) -> str | None: